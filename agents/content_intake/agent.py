@@ -5,11 +5,61 @@ import os
 import sys
 import re
 import urllib.parse
+from itertools import islice
 from datetime import datetime
 
 def get_current_time():
     return datetime.now().isoformat()
 
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+# Patterns that often indicate factual claims. Only whether a sentence matches is used, so
+# number patterns test the last digit alone: a leading \d+ rescans digit runs quadratically
+_CLAIM_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\d%',  # Percentages
+    r'\d (times|people|cases|deaths|studies)',  # Numbers with units
+    r'(scientists?|researchers?|doctors?|experts?) (say|found|discovered|claim)',
+    r'(study|research|report) (shows?|finds?|reveals?)',
+    r'according to',
+    r'(proven|confirmed|verified) (to|that)',
+    r'(causes?|leads? to|results? in)'
+))
+
+_URL_RE = re.compile(r'https?://\S+')
+_MENTION_RE = re.compile(r'@\w+')
+_HASHTAG_RE = re.compile(r'#\w+')
+
+_ORG_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\b(WHO|CDC|FDA|NASA|FBI|CIA|UN|EU|COVID-19|coronavirus)\b',
+    r'\b[A-Z][a-z]+ (University|Hospital|Institute|Organization|Foundation)\b',
+    r'\b(Google|Microsoft|Apple|Facebook|Twitter|Amazon)\b'
+))
+_LOCATION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\b(USA|America|China|India|Europe|Asia|Africa)\b',
+    r'\b[A-Z][a-z]+ (City|State|Country|Province)\b'
+))
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?%?')
+_DATE_RE = re.compile(r'\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b|\b\d{4}\b')
+
+# Substrings counted by detect_language; three hits are enough to call the text English
+_ENGLISH_WORDS = ('the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by')
+
+_TRUSTED_DOMAINS = (
+    "reuters.com", "ap.org", "bbc.com", "npr.org", "pbs.org",
+    "who.int", "cdc.gov", "fda.gov", "nih.gov", "gov.uk"
+)
+_SUSPICIOUS_DOMAINS = ("naturalnews.com", "infowars.com", "beforeitsnews.com")
+
+# (pattern source reported as the indicator, compiled pattern)
+_URGENCY_PATTERNS = tuple((pattern, re.compile(pattern, re.IGNORECASE)) for pattern in (
+    r'\b(breaking|urgent|alert|warning|emergency|immediate)\b',
+    r'\b(now|today|asap|quickly|fast|hurry)\b',
+    r'\b(crisis|disaster|catastrophe|panic)\b',
+    r'!!+',  # Multiple exclamation marks
+    r'\bALL CAPS\b',
+    r'\b(must|need to|have to) (know|see|share|act)\b'
+))
+
 class ContentIntakeAgent:
     """
     Content Intake Agent - Processes data in all forms and prepares it for analysis
@@ -75,9 +125,9 @@ class ContentIntakeAgent:
                 "character_count": len(text_content),
                 "language": self.detect_language(text_content),
                 "urgency_indicators": urgency_indicators,
-                "has_urls": bool(re.search(r'https?://\S+', text_content)),
-                "has_mentions": bool(re.search(r'@\w+', text_content)),
-                "has_hashtags": bool(re.search(r'#\w+', text_content))
+                "has_urls": "://" in text_content and bool(_URL_RE.search(text_content)),
+                "has_mentions": "@" in text_content and bool(_MENTION_RE.search(text_content)),
+                "has_hashtags": "#" in text_content and bool(_HASHTAG_RE.search(text_content))
             },
             "processed_content": text_content.strip(),
             "timestamp": get_current_time()
@@ -86,31 +136,17 @@ class ContentIntakeAgent:
     def extract_claims(self, text):
         """Extract potential factual claims from text"""
         claims = []
-        sentences = re.split(r'[.!?]+', text)
+        pattern_count = len(_CLAIM_PATTERNS)
         
-        # Patterns that often indicate factual claims
-        claim_patterns = [
-            r'\d+%',  # Percentages
-            r'\d+ (times|people|cases|deaths|studies)',  # Numbers with units
-            r'(scientists?|researchers?|doctors?|experts?) (say|found|discovered|claim)',
-            r'(study|research|report) (shows?|finds?|reveals?)',
-            r'according to',
-            r'(proven|confirmed|verified) (to|that)',
-            r'(causes?|leads? to|results? in)'
-        ]
-        
-        for i, sentence in enumerate(sentences):
+        for i, sentence in enumerate(_SENTENCE_SPLIT_RE.split(text)):
             sentence = sentence.strip()
             if len(sentence) > 15:  # Skip very short sentences
-                claim_score = 0
-                for pattern in claim_patterns:
-                    if re.search(pattern, sentence, re.IGNORECASE):
-                        claim_score += 1
+                claim_score = sum(1 for pattern in _CLAIM_PATTERNS if pattern.search(sentence))
                 
                 if claim_score > 0:
                     claims.append({
                         "text": sentence,
-                        "confidence": min(claim_score / len(claim_patterns), 1.0),
+                        "confidence": min(claim_score / pattern_count, 1.0),
                         "position": i
                     })
         
@@ -126,61 +162,31 @@ class ContentIntakeAgent:
             "numbers": []
         }
         
-        # Simple patterns for entity detection
-        org_patterns = [
-            r'\b(WHO|CDC|FDA|NASA|FBI|CIA|UN|EU|COVID-19|coronavirus)\b',
-            r'\b[A-Z][a-z]+ (University|Hospital|Institute|Organization|Foundation)\b',
-            r'\b(Google|Microsoft|Apple|Facebook|Twitter|Amazon)\b'
-        ]
-        
-        location_patterns = [
-            r'\b(USA|America|China|India|Europe|Asia|Africa)\b',
-            r'\b[A-Z][a-z]+ (City|State|Country|Province)\b'
-        ]
-        
-        person_patterns = [
-            r'\b(Dr\.|Professor|President|Minister) [A-Z][a-z]+\b',
-            r'\b[A-Z][a-z]+ [A-Z][a-z]+\b'  # Simple name pattern
-        ]
-        
         # Extract entities
-        for pattern in org_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            entities["organizations"].extend(matches)
+        for pattern in _ORG_PATTERNS:
+            entities["organizations"].extend(pattern.findall(text))
         
-        for pattern in location_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            entities["locations"].extend(matches)
+        for pattern in _LOCATION_PATTERNS:
+            entities["locations"].extend(pattern.findall(text))
         
-        # Extract numbers and percentages
-        numbers = re.findall(r'\d+(?:\.\d+)?%?', text)
-        entities["numbers"] = numbers[:10]  # Limit to first 10
+        # Extract numbers and percentages, stopping at the first 10
+        entities["numbers"] = [match.group() for match in islice(_NUMBER_RE.finditer(text), 10)]
         
-        # Extract dates
-        dates = re.findall(r'\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b|\b\d{4}\b', text)
-        entities["dates"] = dates[:5]  # Limit to first 5
+        # Extract dates, stopping at the first 5
+        entities["dates"] = [match.group() for match in islice(_DATE_RE.finditer(text), 5)]
         
         return entities
     
     def analyze_urgency(self, text):
         """Analyze urgency indicators in text"""
-        urgency_patterns = [
-            r'\b(breaking|urgent|alert|warning|emergency|immediate)\b',
-            r'\b(now|today|asap|quickly|fast|hurry)\b',
-            r'\b(crisis|disaster|catastrophe|panic)\b',
-            r'!!+',  # Multiple exclamation marks
-            r'\bALL CAPS\b',
-            r'\b(must|need to|have to) (know|see|share|act)\b'
-        ]
-        
         indicators = []
         urgency_score = 0
         
-        for pattern in urgency_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                indicators.append(pattern)
-                urgency_score += len(matches)
+        for source, pattern in _URGENCY_PATTERNS:
+            match_count = len(pattern.findall(text))
+            if match_count:
+                indicators.append(source)
+                urgency_score += match_count
         
         # Check for excessive capitalization
         if text.isupper() and len(text) > 20:
@@ -198,14 +204,15 @@ class ContentIntakeAgent:
         # This is a very basic implementation
         # In production, you'd use a proper language detection library
         
-        english_words = ['the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by']
         text_lower = text.lower()
-        english_count = sum(1 for word in english_words if word in text_lower)
+        english_count = 0
+        for word in _ENGLISH_WORDS:
+            if word in text_lower:
+                english_count += 1
+                if english_count >= 3:
+                    return "en"
         
-        if english_count >= 3:
-            return "en"
-        else:
-            return "unknown"
+        return "unknown"
 
     def process_image(self, image_content):
         """Process image content (simulated)"""
@@ -277,21 +284,12 @@ class ContentIntakeAgent:
             domain = parsed.netloc.lower()
             
             # Analyze domain credibility
-            trusted_domains = [
-                "reuters.com", "ap.org", "bbc.com", "npr.org", "pbs.org",
-                "who.int", "cdc.gov", "fda.gov", "nih.gov", "gov.uk"
-            ]
-            
-            suspicious_domains = [
-                "naturalnews.com", "infowars.com", "beforeitsnews.com"
-            ]
-            
             credibility = "unknown"
-            if any(trusted in domain for trusted in trusted_domains):
+            if any(trusted in domain for trusted in _TRUSTED_DOMAINS):
                 credibility = "high"
-            elif any(suspicious in domain for suspicious in suspicious_domains):
+            elif any(suspicious in domain for suspicious in _SUSPICIOUS_DOMAINS):
                 credibility = "low"
-            elif domain.endswith(".gov") or domain.endswith(".edu"):
+            elif domain.endswith((".gov", ".edu")):
                 credibility = "high"
             
             return {
@@ -11,6 +11,31 @@ from datetime import datetime
 def get_current_time():
     return datetime.now().isoformat()
 
+# Common misinformation patterns. These are literal lowercase phrases, so lowercased text
+# can be checked with plain substring tests
+_RED_FLAG_PATTERNS = (
+    "doctors hate this",
+    "they don't want you to know",
+    "secret cure",
+    "100% natural",
+    "miracle cure",
+    "big pharma doesn't want",
+    "breaking news",
+    "shocking discovery",
+    "exclusive footage",
+    "leaked documents"
+)
+_RED_FLAG_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in _RED_FLAG_PATTERNS)
+
+_CONSPIRACY_PATTERNS = ("big pharma", "they don't want", "cover up", "hidden truth", "wake up")
+
+_PRIORITY_HEALTH_KEYWORDS = ("vaccine", "cure", "treatment", "doctor", "medicine", "health", "disease")
+_PRIORITY_POLITICAL_KEYWORDS = ("election", "government", "politician", "vote", "policy")
+
+_METHOD_HEALTH_KEYWORDS = ("vaccine", "cure", "treatment", "doctor", "medicine", "health")
+_METHOD_POLITICAL_KEYWORDS = ("election", "government", "politician", "vote")
+_METHOD_SCIENCE_KEYWORDS = ("study", "research", "scientists", "discovery", "breakthrough")
+
 class FactCheckAgent:
     """
     Most Important Agent - Fact Check Agent
@@ -48,18 +73,7 @@ class FactCheckAgent:
         }
         
         # Common misinformation patterns
-        self.red_flag_patterns = [
-            r"doctors hate this",
-            r"they don't want you to know",
-            r"secret cure",
-            r"100% natural",
-            r"miracle cure",
-            r"big pharma doesn't want",
-            r"breaking news",
-            r"shocking discovery",
-            r"exclusive footage",
-            r"leaked documents"
-        ]
+        self.red_flag_patterns = _RED_FLAG_PATTERNS
     
     def __call__(self, input_data):
         return self.process(input_data)
@@ -133,20 +147,19 @@ class FactCheckAgent:
     def calculate_claim_priority(self, claim_text):
         """Calculate priority for fact-checking based on content"""
         priority = 0.5  # Base priority
+        claim_lower = claim_text.lower()
         
         # Check for red flag patterns
-        for pattern in self.red_flag_patterns:
-            if re.search(pattern, claim_text.lower()):
+        for pattern in _RED_FLAG_PATTERNS:
+            if pattern in claim_lower:
                 priority += 0.3
         
         # Health/medical claims get higher priority
-        health_keywords = ["vaccine", "cure", "treatment", "doctor", "medicine", "health", "disease"]
-        if any(keyword in claim_text.lower() for keyword in health_keywords):
+        if any(keyword in claim_lower for keyword in _PRIORITY_HEALTH_KEYWORDS):
             priority += 0.2
         
         # Political claims get higher priority
-        political_keywords = ["election", "government", "politician", "vote", "policy"]
-        if any(keyword in claim_text.lower() for keyword in political_keywords):
+        if any(keyword in claim_lower for keyword in _PRIORITY_POLITICAL_KEYWORDS):
             priority += 0.15
         
         return min(priority, 1.0)  # Cap at 1.0
@@ -154,20 +167,18 @@ class FactCheckAgent:
     def determine_check_methods(self, claim_text):
         """Determine which fact-checking methods to use based on content"""
         methods = ["news_sources"]  # Always check news sources
+        claim_lower = claim_text.lower()
         
         # Health claims - check academic and government sources
-        health_keywords = ["vaccine", "cure", "treatment", "doctor", "medicine", "health"]
-        if any(keyword in claim_text.lower() for keyword in health_keywords):
+        if any(keyword in claim_lower for keyword in _METHOD_HEALTH_KEYWORDS):
             methods.extend(["academic", "government"])
         
         # Political claims - check government and fact-checkers
-        political_keywords = ["election", "government", "politician", "vote"]
-        if any(keyword in claim_text.lower() for keyword in political_keywords):
+        if any(keyword in claim_lower for keyword in _METHOD_POLITICAL_KEYWORDS):
             methods.extend(["government", "fact_checkers"])
         
         # Scientific claims - check academic sources
-        science_keywords = ["study", "research", "scientists", "discovery", "breakthrough"]
-        if any(keyword in claim_text.lower() for keyword in science_keywords):
+        if any(keyword in claim_lower for keyword in _METHOD_SCIENCE_KEYWORDS):
             methods.append("academic")
         
         return list(set(methods))  # Remove duplicates
@@ -206,8 +217,7 @@ class FactCheckAgent:
         # This would be replaced with actual API calls in production
         
         # Simulate credibility based on content analysis
-        red_flag_score = sum(1 for pattern in self.red_flag_patterns 
-                           if re.search(pattern, claim_text, re.IGNORECASE))
+        red_flag_score = sum(1 for pattern in _RED_FLAG_RES if pattern.search(claim_text))
         
         # Base credibility (more aggressive penalty for red flags)
         base_credibility = max(0.1, 0.9 - (red_flag_score * 0.25))
@@ -217,9 +227,8 @@ class FactCheckAgent:
             base_credibility *= 0.7  # Heavy penalty for multiple red flags
         
         # Check for conspiracy/misleading language patterns
-        conspiracy_patterns = ["big pharma", "they don't want", "cover up", "hidden truth", "wake up"]
-        conspiracy_score = sum(1 for pattern in conspiracy_patterns 
-                             if pattern in claim_text.lower())
+        claim_lower = claim_text.lower()
+        conspiracy_score = sum(1 for pattern in _CONSPIRACY_PATTERNS if pattern in claim_lower)
         
         if conspiracy_score > 0:
             base_credibility *= (0.8 - conspiracy_score * 0.1)  # Additional penalty for conspiracy language
@@ -4,12 +4,268 @@
 
 import os
 import sys
+import re
 import random
+from bisect import bisect_right
 from datetime import datetime
+from types import MappingProxyType
+from typing import NamedTuple
 
 def get_current_time():
     return datetime.now().isoformat()
 
+def _error_response(error, timestamp):
+    """Build the error payload returned when knowledge processing fails"""
+    return {
+        "status": "error",
+        "error": str(error),
+        "timestamp": timestamp
+    }
+
+# Static guidance keyed by content type, built once at import time
+_VERIFICATION_GUIDES = MappingProxyType({
+    "text": (
+        "1. Check the original source and date",
+        "2. Look for author credentials and expertise",
+        "3. Cross-reference with credible news sources",
+        "4. Search for fact-checking websites",
+        "5. Examine supporting evidence and citations"
+    ),
+    "image": (
+        "1. Reverse image search to find original source",
+        "2. Check metadata and creation date",
+        "3. Look for signs of manipulation or editing",
+        "4. Verify the context and location",
+        "5. Cross-reference with reliable news sources"
+    ),
+    "video": (
+        "1. Check upload date and original source",
+        "2. Analyze video quality and potential editing",
+        "3. Verify location and timestamp",
+        "4. Cross-reference events with news sources",
+        "5. Look for creator's credibility and history"
+    ),
+    "audio": (
+        "1. Identify the speaker and verify authenticity",
+        "2. Check recording quality and potential manipulation",
+        "3. Verify context and date of recording",
+        "4. Cross-reference claims with credible sources",
+        "5. Look for official statements or confirmations"
+    )
+})
+
+_MEDIA_LITERACY_TIPS = MappingProxyType({
+    "text": (
+        "Check multiple sources before believing claims",
+        "Look for citations and references to original sources",
+        "Be skeptical of emotional or sensational language",
+        "Verify author credentials and publication date"
+    ),
+    "image": (
+        "Use reverse image search to check origins",
+        "Look for signs of digital manipulation",
+        "Check if the image context matches the claim",
+        "Verify the source and date of the image"
+    ),
+    "video": (
+        "Check video metadata and upload date",
+        "Look for signs of editing or deepfakes",
+        "Verify if audio matches video content",
+        "Cross-reference with other sources"
+    )
+})
+
+_VERIFICATION_METHODS = MappingProxyType({
+    "text": (
+        "Cross-reference with established fact-checking sites",
+        "Check primary sources and original research",
+        "Look for scientific peer review if applicable",
+        "Verify quotes and statistics independently"
+    ),
+    "image": (
+        "Use Google Images or TinEye reverse search",
+        "Check EXIF data for manipulation signs",
+        "Consult image forensics tools",
+        "Verify location and timing claims"
+    ),
+    "video": (
+        "Check video metadata and timestamps",
+        "Use video verification tools like InVID",
+        "Analyze audio-visual synchronization",
+        "Verify claims about location and time"
+    )
+})
+
+_SOURCE_EVALUATION_GUIDE = MappingProxyType({
+    "credible_indicators": (
+        "Author expertise and credentials listed",
+        "Publication date clearly stated",
+        "Sources and references provided",
+        "Contact information available",
+        "Professional editorial standards",
+        "Transparent funding and ownership"
+    ),
+    "red_flag_indicators": (
+        "Anonymous or unknown authors",
+        "No publication date or sources",
+        "Sensational headlines or language",
+        "Poor grammar and spelling",
+        "Obvious bias or agenda",
+        "Requests for money or personal information"
+    )
+})
+
+# Interned pattern types and severities so hot-path comparisons and lookups hit by identity
+_EMOTIONAL_MANIPULATION = sys.intern("emotional_manipulation")
+_FALSE_AUTHORITY = sys.intern("false_authority")
+_CONSPIRACY_THINKING = sys.intern("conspiracy_thinking")
+_STATISTICAL_MANIPULATION = sys.intern("statistical_manipulation")
+_ARTIFICIAL_URGENCY = sys.intern("artificial_urgency")
+_STATISTIC = sys.intern("statistic")
+_CITATION = sys.intern("citation")
+_SEVERITY_HIGH = sys.intern("high")
+_SEVERITY_MEDIUM = sys.intern("medium")
+
+class MisinformationPattern(NamedTuple):
+    """A misinformation pattern detected in content"""
+    type: str
+    description: str
+    severity: str
+
+# Keyword groups scanned by detect_misinformation_patterns
+_EMOTIONAL_TRIGGERS = ("shocking", "outrageous", "they don't want you to know", "secret", "hidden truth")
+_AUTHORITY_PATTERNS = ("doctors hate this", "experts don't want", "big pharma hides")
+_CONSPIRACY_WORDS = ("cover-up", "conspiracy", "they're hiding", "wake up", "sheeple")
+_CITATION_WORDS = ("study", "research", "published")
+_URGENCY_WORDS = ("breaking", "urgent", "immediate", "act now", "before it's too late")
+_STATISTIC_PHRASES = ("times more likely",)
+
+def _keyword_group(name, keywords):
+    return f"(?P<{name}>{'|'.join(re.escape(keyword) for keyword in keywords)})"
+
+# One alternation over all keyword groups; the named group that matched identifies the group.
+# Keywords match as substrings ("researchers" cites research, "secrets" is a trigger), and
+# the lookahead consumes nothing so overlapping keywords from different groups are all found
+_KEYWORD_RE = re.compile(
+    r"(?=(?:"
+    + "|".join([
+        _keyword_group(_EMOTIONAL_MANIPULATION, _EMOTIONAL_TRIGGERS),
+        _keyword_group(_FALSE_AUTHORITY, _AUTHORITY_PATTERNS),
+        _keyword_group(_CONSPIRACY_THINKING, _CONSPIRACY_WORDS),
+        _keyword_group(_ARTIFICIAL_URGENCY, _URGENCY_WORDS),
+        _keyword_group(_STATISTIC, _STATISTIC_PHRASES),
+        _keyword_group(_CITATION, _CITATION_WORDS)
+    ])
+    + r"))",
+    re.IGNORECASE
+)
+_KEYWORD_GROUP_BY_INDEX = {index: sys.intern(name) for name, index in _KEYWORD_RE.groupindex.items()}
+
+def _scan_keyword_hits(contents):
+    """Scan many contents in one pass, returning the keyword groups hit by each"""
+    # Non-text contents are blanked out; the NUL separators keep matches from spanning two contents
+    scanned = [content if isinstance(content, str) else "" for content in contents]
+    
+    offsets = []
+    offset = 0
+    for content in scanned:
+        offsets.append(offset)
+        offset += len(content) + 1
+    
+    keyword_hits = [set() for _ in scanned]
+    for match in _KEYWORD_RE.finditer("\x00".join(scanned)):
+        index = bisect_right(offsets, match.start()) - 1
+        keyword_hits[index].add(_KEYWORD_GROUP_BY_INDEX[match.lastindex])
+    
+    return keyword_hits
+
+# Pattern-specific explanations, tips and resources
+_EXPLANATIONS = {
+    _EMOTIONAL_MANIPULATION: "This content uses emotional language designed to provoke strong reactions. "
+                              "Emotional manipulation can cloud judgment and make people less likely to "
+                              "fact-check information before sharing it.",
+    _FALSE_AUTHORITY: "This content makes claims about what experts think without providing "
+                       "credible sources. Legitimate expert opinions are published in peer-reviewed "
+                       "journals or official statements from recognized institutions.",
+    _CONSPIRACY_THINKING: "This content promotes conspiracy theories that assume coordinated deception "
+                           "without providing verifiable evidence. Real conspiracies are eventually "
+                           "exposed through investigative journalism and whistleblowers with documentation.",
+    _STATISTICAL_MANIPULATION: "This content uses statistics or percentages without citing the original "
+                                "research or study. Legitimate statistics should be traceable to peer-reviewed "
+                                "research with proper methodology and sample sizes.",
+    _ARTIFICIAL_URGENCY: "This content creates artificial urgency to encourage immediate sharing "
+                          "without verification. Legitimate urgent information comes through official "
+                          "channels like government agencies or established news organizations."
+}
+
+_EDUCATION_TOPIC_BY_TYPE = {
+    _EMOTIONAL_MANIPULATION: "logical_fallacies",
+    _FALSE_AUTHORITY: "source_credibility",
+    _CONSPIRACY_THINKING: "source_credibility",
+    _STATISTICAL_MANIPULATION: "statistical_manipulation",
+    _ARTIFICIAL_URGENCY: "logical_fallacies"
+}
+
+_TIP_BY_TYPE = {
+    _EMOTIONAL_MANIPULATION: "When content makes you feel strongly (angry, scared, excited), take a pause before sharing",
+    _FALSE_AUTHORITY: "Look up the credentials of anyone cited as an expert - are they qualified in this specific field?",
+    _CONSPIRACY_THINKING: "Ask for evidence: What documentation supports these claims? Are there credible whistleblowers?",
+    _STATISTICAL_MANIPULATION: "Look for the original study behind any statistics - check the sample size and methodology",
+    _ARTIFICIAL_URGENCY: "Urgent claims should be verified through multiple official sources before sharing"
+}
+
+_BASE_RECOMMENDED_ACTIONS = (
+    "Do not share this content",
+    "Check multiple reliable sources",
+    "Look for official statements from authorities",
+    "Be skeptical of sensational claims"
+)
+
+_BASE_RESOURCES = (
+    {
+        "title": "How to Spot Misinformation",
+        "description": "A guide to identifying common misinformation tactics",
+        "type": "guide"
+    },
+    {
+        "title": "Credible Fact-Checking Organizations",
+        "description": "List of reputable fact-checking websites and organizations",
+        "type": "resource_list"
+    }
+)
+
+_EXTRA_RESOURCE_BY_TYPE = {
+    _STATISTICAL_MANIPULATION: {
+        "title": "Understanding Statistics in Media",
+        "description": "How to evaluate statistical claims in news and social media",
+        "type": "educational_guide"
+    },
+    _CONSPIRACY_THINKING: {
+        "title": "Critical Thinking and Conspiracy Theories",
+        "description": "How to apply critical thinking to extraordinary claims",
+        "type": "educational_guide"
+    }
+}
+
+_DEFAULT_TIPS = (
+    "Check if other reputable news sources are reporting the same information",
+    "Look for official statements from relevant authorities or institutions",
+    "Be skeptical of information that seems too good (or bad) to be true"
+)
+
+_LEARNING_RESOURCE_BY_TYPE = {
+    _EMOTIONAL_MANIPULATION: {
+        "title": "Recognizing Emotional Manipulation",
+        "type": "guide",
+        "content": "Understand how emotions are used to bypass critical thinking"
+    },
+    _STATISTICAL_MANIPULATION: {
+        "title": "Understanding Statistical Manipulation",
+        "type": "guide",
+        "content": "Learn how statistics can be misleading and how to spot manipulation"
+    }
+}
+
 class KnowledgeAgent:
     """
     Knowledge Agent
@@ -105,6 +361,22 @@ class KnowledgeAgent:
     
     def process(self, input_data):
         """Main knowledge processing and education"""
+        # Reuse the caller's pipeline timestamp when one is supplied
+        return self._process_one(input_data, input_data.get("timestamp") or get_current_time())
+    
+    def process_batch(self, batch):
+        """Process several inputs, scanning all contents for keyword patterns in one pass"""
+        now = get_current_time()
+        contents = [input_data.get("content", "") for input_data in batch]
+        batch_keyword_hits = _scan_keyword_hits(contents)
+        
+        return [
+            self._process_one(input_data, input_data.get("timestamp") or now, keyword_hits)
+            for input_data, keyword_hits in zip(batch, batch_keyword_hits)
+        ]
+    
+    def _process_one(self, input_data, now, keyword_hits=None):
+        """Build the education response for a single input"""
         fact_check_result = input_data.get("fact_check_result", {})
         content = input_data.get("content", "")
         content_type = input_data.get("content_type", "text")
@@ -117,29 +389,28 @@ class KnowledgeAgent:
             
             if is_misinformation or credibility_score < 0.4:
                 return self.generate_misinformation_education(
-                    fact_check_result, content, content_type
+                    fact_check_result, content, content_type, now=now, keyword_hits=keyword_hits
                 )
             elif credibility_score > 0.7:
                 return self.generate_verification_education(
-                    fact_check_result, content, content_type
+                    fact_check_result, content, content_type, now=now
                 )
             else:
                 return self.generate_general_education(
-                    fact_check_result, content, content_type
+                    fact_check_result, content, content_type, now=now
                 )
                 
         except Exception as e:
-            return {
-                "status": "error",
-                "error": str(e),
-                "timestamp": get_current_time()
-            }
+            return _error_response(e, now)
     
-    def generate_misinformation_education(self, fact_check_result, content, content_type):
+    def generate_misinformation_education(self, fact_check_result, content, content_type, now=None, keyword_hits=None):
         """Generate educational content for identified misinformation"""
         
-        # Detect misinformation patterns
-        patterns = self.detect_misinformation_patterns(content, fact_check_result)
+        # Detect misinformation patterns (metadata-only verdicts carry no text to scan)
+        if not content or content.isspace():
+            patterns = []
+        else:
+            patterns = self.detect_misinformation_patterns(content, fact_check_result, keyword_hits)
         
         # Generate explanations
         explanations = self.build_explanations(patterns, fact_check_result)
@@ -147,8 +418,11 @@ class KnowledgeAgent:
         # Select relevant educational content
         educational_content = self.select_educational_content(patterns)
         
+        # Pattern types shared by the tip and resource helpers
+        pattern_types = frozenset(pattern.type for pattern in patterns)
+        
         # Generate practical tips
-        tips = self.generate_fact_checking_tips(patterns)
+        tips = self.generate_fact_checking_tips(pattern_types)
         
         return {
             "status": "completed",
@@ -157,22 +431,17 @@ class KnowledgeAgent:
             "credibility_score": fact_check_result.get("credibility_score", 0.0),
             "explanation": {
                 "summary": "This content shows characteristics of misinformation",
-                "patterns_detected": patterns,
+                "patterns_detected": [pattern._asdict() for pattern in patterns],
                 "detailed_explanations": explanations
             },
             "educational_content": educational_content,
             "actionable_tips": tips,
-            "recommended_actions": [
-                "Do not share this content",
-                "Check multiple reliable sources",
-                "Look for official statements from authorities",
-                "Be skeptical of sensational claims"
-            ],
-            "additional_resources": self.get_additional_resources(patterns),
-            "timestamp": get_current_time()
+            "recommended_actions": list(_BASE_RECOMMENDED_ACTIONS),
+            "additional_resources": self.get_additional_resources(pattern_types),
+            "timestamp": now or get_current_time()
         }
     
-    def generate_verification_education(self, fact_check_result, content, content_type):
+    def generate_verification_education(self, fact_check_result, content, content_type, now=None):
         """Generate educational content for verified information"""
         
         return {
@@ -197,10 +466,10 @@ class KnowledgeAgent:
                 "Stay updated as new information becomes available",
                 "Share responsibly with proper context"
             ],
-            "timestamp": get_current_time()
+            "timestamp": now or get_current_time()
         }
     
-    def generate_general_education(self, fact_check_result, content, content_type):
+    def generate_general_education(self, fact_check_result, content, content_type, now=None):
         """Generate general educational content about fact-checking"""
         
         # Select random educational topic
@@ -229,160 +498,89 @@ class KnowledgeAgent:
                 "4. Check the date - Is the information current?",
                 "5. Consider context - Is information presented fairly?"
             ],
-            "timestamp": get_current_time()
+            "timestamp": now or get_current_time()
         }
     
-    def detect_misinformation_patterns(self, content, fact_check_result):
+    def detect_misinformation_patterns(self, content, fact_check_result, keyword_hits=None):
         """Detect misinformation patterns in content"""
+        if not content:
+            return []
+        
         patterns_found = []
-        content_lower = content.lower()
+        
+        # Single case-insensitive pass over the content for every keyword group,
+        # unless a batch scan already produced the hits
+        if keyword_hits is None:
+            keyword_hits = {_KEYWORD_GROUP_BY_INDEX[match.lastindex] for match in _KEYWORD_RE.finditer(content)}
         
         # Check for emotional manipulation
-        emotional_triggers = ["shocking", "outrageous", "they don't want you to know", "secret", "hidden truth"]
-        if any(trigger in content_lower for trigger in emotional_triggers):
-            patterns_found.append({
-                "type": "emotional_manipulation",
-                "description": "Uses emotional language to bypass critical thinking",
-                "severity": "medium"
-            })
+        if _EMOTIONAL_MANIPULATION in keyword_hits:
+            patterns_found.append(MisinformationPattern(
+                _EMOTIONAL_MANIPULATION,
+                "Uses emotional language to bypass critical thinking",
+                _SEVERITY_MEDIUM
+            ))
         
         # Check for false authority
-        authority_patterns = ["doctors hate this", "experts don't want", "big pharma hides"]
-        if any(pattern in content_lower for pattern in authority_patterns):
-            patterns_found.append({
-                "type": "false_authority",
-                "description": "Makes claims about expert opinion without credible sources",
-                "severity": "high"
-            })
+        if _FALSE_AUTHORITY in keyword_hits:
+            patterns_found.append(MisinformationPattern(
+                _FALSE_AUTHORITY,
+                "Makes claims about expert opinion without credible sources",
+                _SEVERITY_HIGH
+            ))
         
         # Check for conspiracy thinking
-        conspiracy_words = ["cover-up", "conspiracy", "they're hiding", "wake up", "sheeple"]
-        if any(word in content_lower for word in conspiracy_words):
-            patterns_found.append({
-                "type": "conspiracy_thinking",
-                "description": "Promotes conspiracy theories without evidence",
-                "severity": "high"
-            })
+        if _CONSPIRACY_THINKING in keyword_hits:
+            patterns_found.append(MisinformationPattern(
+                _CONSPIRACY_THINKING,
+                "Promotes conspiracy theories without evidence",
+                _SEVERITY_HIGH
+            ))
         
         # Check for statistical manipulation
-        if "%" in content or "times more likely" in content_lower:
-            if not any(source in content_lower for source in ["study", "research", "published"]):
-                patterns_found.append({
-                    "type": "statistical_manipulation",
-                    "description": "Uses statistics without citing credible sources",
-                    "severity": "medium"
-                })
+        if "%" in content or _STATISTIC in keyword_hits:
+            if _CITATION not in keyword_hits:
+                patterns_found.append(MisinformationPattern(
+                    _STATISTICAL_MANIPULATION,
+                    "Uses statistics without citing credible sources",
+                    _SEVERITY_MEDIUM
+                ))
         
         # Check for urgency without verification
-        urgency_words = ["breaking", "urgent", "immediate", "act now", "before it's too late"]
-        if any(word in content_lower for word in urgency_words):
-            patterns_found.append({
-                "type": "artificial_urgency",
-                "description": "Creates false sense of urgency to prevent fact-checking",
-                "severity": "medium"
-            })
+        if _ARTIFICIAL_URGENCY in keyword_hits:
+            patterns_found.append(MisinformationPattern(
+                _ARTIFICIAL_URGENCY,
+                "Creates false sense of urgency to prevent fact-checking",
+                _SEVERITY_MEDIUM
+            ))
         
         return patterns_found
     
     def build_explanations(self, patterns, fact_check_result):
         """Build detailed explanations for detected patterns"""
-        explanations = []
-        
-        for pattern in patterns:
-            pattern_type = pattern["type"]
-            
-            if pattern_type == "emotional_manipulation":
-                explanations.append({
-                    "pattern": pattern_type,
-                    "explanation": "This content uses emotional language designed to provoke strong reactions. "
-                                 "Emotional manipulation can cloud judgment and make people less likely to "
-                                 "fact-check information before sharing it."
-                })
-            
-            elif pattern_type == "false_authority":
-                explanations.append({
-                    "pattern": pattern_type,
-                    "explanation": "This content makes claims about what experts think without providing "
-                                 "credible sources. Legitimate expert opinions are published in peer-reviewed "
-                                 "journals or official statements from recognized institutions."
-                })
-            
-            elif pattern_type == "conspiracy_thinking":
-                explanations.append({
-                    "pattern": pattern_type,
-                    "explanation": "This content promotes conspiracy theories that assume coordinated deception "
-                                 "without providing verifiable evidence. Real conspiracies are eventually "
-                                 "exposed through investigative journalism and whistleblowers with documentation."
-                })
-            
-            elif pattern_type == "statistical_manipulation":
-                explanations.append({
-                    "pattern": pattern_type,
-                    "explanation": "This content uses statistics or percentages without citing the original "
-                                 "research or study. Legitimate statistics should be traceable to peer-reviewed "
-                                 "research with proper methodology and sample sizes."
-                })
-            
-            elif pattern_type == "artificial_urgency":
-                explanations.append({
-                    "pattern": pattern_type,
-                    "explanation": "This content creates artificial urgency to encourage immediate sharing "
-                                 "without verification. Legitimate urgent information comes through official "
-                                 "channels like government agencies or established news organizations."
-                })
-        
-        return explanations
+        return [
+            {"pattern": pattern.type, "explanation": _EXPLANATIONS[pattern.type]}
+            for pattern in patterns
+            if pattern.type in _EXPLANATIONS
+        ]
     
     def select_educational_content(self, patterns):
         """Select relevant educational content based on detected patterns"""
         if not patterns:
             return self.educational_content["source_credibility"]
         
-        # Map patterns to educational content
-        pattern_mapping = {
-            "emotional_manipulation": "logical_fallacies",
-            "false_authority": "source_credibility", 
-            "conspiracy_thinking": "source_credibility",
-            "statistical_manipulation": "statistical_manipulation",
-            "artificial_urgency": "logical_fallacies"
-        }
-        
         # Select most relevant content
-        primary_pattern = patterns[0]["type"]
-        content_key = pattern_mapping.get(primary_pattern, "source_credibility")
+        primary_pattern = patterns[0].type
+        content_key = _EDUCATION_TOPIC_BY_TYPE.get(primary_pattern, "source_credibility")
         
         return self.educational_content[content_key]
     
-    def generate_fact_checking_tips(self, patterns):
-        """Generate specific fact-checking tips based on patterns"""
-        tips = []
-        
-        pattern_types = [p["type"] for p in patterns]
-        
-        if "emotional_manipulation" in pattern_types:
-            tips.append("When content makes you feel strongly (angry, scared, excited), take a pause before sharing")
-        
-        if "false_authority" in pattern_types:
-            tips.append("Look up the credentials of anyone cited as an expert - are they qualified in this specific field?")
-        
-        if "conspiracy_thinking" in pattern_types:
-            tips.append("Ask for evidence: What documentation supports these claims? Are there credible whistleblowers?")
-        
-        if "statistical_manipulation" in pattern_types:
-            tips.append("Look for the original study behind any statistics - check the sample size and methodology")
-        
-        if "artificial_urgency" in pattern_types:
-            tips.append("Urgent claims should be verified through multiple official sources before sharing")
+    def generate_fact_checking_tips(self, pattern_types):
+        """Generate specific fact-checking tips based on detected pattern types"""
+        tips = [tip for pattern_type, tip in _TIP_BY_TYPE.items() if pattern_type in pattern_types]
         
         # Add general tips if no specific patterns
-        if not tips:
-            tips = [
-                "Check if other reputable news sources are reporting the same information",
-                "Look for official statements from relevant authorities or institutions",
-                "Be skeptical of information that seems too good (or bad) to be true"
-            ]
-        
-        return tips
+        return tips or list(_DEFAULT_TIPS)
     
     def explain_verification_process(self, fact_check_result):
         """Explain how the fact-checking verification was done"""
@@ -398,47 +596,24 @@ class KnowledgeAgent:
         
         return explanation
     
-    def get_additional_resources(self, patterns):
-        """Get additional educational resources based on patterns"""
-        resources = [
-            {
-                "title": "How to Spot Misinformation",
-                "description": "A guide to identifying common misinformation tactics",
-                "type": "guide"
-            },
-            {
-                "title": "Credible Fact-Checking Organizations",
-                "description": "List of reputable fact-checking websites and organizations",
-                "type": "resource_list"
-            }
-        ]
-        
-        pattern_types = [p["type"] for p in patterns]
-        
-        if "statistical_manipulation" in pattern_types:
-            resources.append({
-                "title": "Understanding Statistics in Media",
-                "description": "How to evaluate statistical claims in news and social media",
-                "type": "educational_guide"
-            })
-        
-        if "conspiracy_thinking" in pattern_types:
-            resources.append({
-                "title": "Critical Thinking and Conspiracy Theories",
-                "description": "How to apply critical thinking to extraordinary claims",
-                "type": "educational_guide"
-            })
-        
+    def get_additional_resources(self, pattern_types):
+        """Get additional educational resources based on detected pattern types"""
+        resources = [dict(resource) for resource in _BASE_RESOURCES]
+        resources.extend(
+            dict(resource)
+            for pattern_type, resource in _EXTRA_RESOURCE_BY_TYPE.items()
+            if pattern_type in pattern_types
+        )
         return resources
         
         # Create learning resources
-        learning_resources = self.create_learning_resources(patterns)
+        learning_resources = self.create_learning_resources(pattern_types)
         
         return {
             "status": "misinformation_detected",
             "verdict": "This content contains misinformation",
             "credibility_score": fact_check_result.get("credibility_score", 0.0),
-            "misinformation_patterns": patterns,
+            "misinformation_patterns": [pattern._asdict() for pattern in patterns],
             "explanations": explanations,
             "educational_content": educational_content,
             "learning_resources": learning_resources,
@@ -449,7 +624,7 @@ class KnowledgeAgent:
             "timestamp": get_current_time()
         }
     
-    def generate_general_education(self, fact_check_result, content, content_type):
+    def generate_general_education(self, fact_check_result, content, content_type, now=None):
         """Generate educational content for verified or uncertain content"""
         
         credibility_score = fact_check_result.get("credibility_score", 0.5)
@@ -480,7 +655,7 @@ class KnowledgeAgent:
             "verification_methods": self.suggest_verification_methods(content_type),
             "critical_thinking_questions": self.generate_critical_questions(content),
             "source_evaluation_guide": self.get_source_evaluation_guide(),
-            "timestamp": get_current_time()
+            "timestamp": now or get_current_time()
         }
     
     def identify_red_flags(self, content):
@@ -489,38 +664,7 @@ class KnowledgeAgent:
     
     def generate_verification_guide(self, content_type):
         """Generate step-by-step verification guide"""
-        guides = {
-            "text": [
-                "1. Check the original source and date",
-                "2. Look for author credentials and expertise",
-                "3. Cross-reference with credible news sources",
-                "4. Search for fact-checking websites",
-                "5. Examine supporting evidence and citations"
-            ],
-            "image": [
-                "1. Reverse image search to find original source",
-                "2. Check metadata and creation date",
-                "3. Look for signs of manipulation or editing",
-                "4. Verify the context and location",
-                "5. Cross-reference with reliable news sources"
-            ],
-            "video": [
-                "1. Check upload date and original source",
-                "2. Analyze video quality and potential editing",
-                "3. Verify location and timestamp",
-                "4. Cross-reference events with news sources",
-                "5. Look for creator's credibility and history"
-            ],
-            "audio": [
-                "1. Identify the speaker and verify authenticity",
-                "2. Check recording quality and potential manipulation",
-                "3. Verify context and date of recording",
-                "4. Cross-reference claims with credible sources",
-                "5. Look for official statements or confirmations"
-            ]
-        }
-        
-        return guides.get(content_type, guides["text"])
+        return _VERIFICATION_GUIDES.get(content_type, _VERIFICATION_GUIDES["text"])
     
     def find_similar_debunked_claims(self, content):
         """Find similar claims that have been debunked"""
@@ -559,51 +703,11 @@ class KnowledgeAgent:
     
     def generate_media_literacy_tips(self, content_type):
         """Generate media literacy tips"""
-        tips = {
-            "text": [
-                "Check multiple sources before believing claims",
-                "Look for citations and references to original sources",
-                "Be skeptical of emotional or sensational language",
-                "Verify author credentials and publication date"
-            ],
-            "image": [
-                "Use reverse image search to check origins",
-                "Look for signs of digital manipulation",
-                "Check if the image context matches the claim",
-                "Verify the source and date of the image"
-            ],
-            "video": [
-                "Check video metadata and upload date",
-                "Look for signs of editing or deepfakes",
-                "Verify if audio matches video content",
-                "Cross-reference with other sources"
-            ]
-        }
-        return tips.get(content_type, tips["text"])
+        return _MEDIA_LITERACY_TIPS.get(content_type, _MEDIA_LITERACY_TIPS["text"])
     
     def suggest_verification_methods(self, content_type):
         """Suggest specific verification methods"""
-        methods = {
-            "text": [
-                "Cross-reference with established fact-checking sites",
-                "Check primary sources and original research",
-                "Look for scientific peer review if applicable",
-                "Verify quotes and statistics independently"
-            ],
-            "image": [
-                "Use Google Images or TinEye reverse search",
-                "Check EXIF data for manipulation signs",
-                "Consult image forensics tools",
-                "Verify location and timing claims"
-            ],
-            "video": [
-                "Check video metadata and timestamps",
-                "Use video verification tools like InVID",
-                "Analyze audio-visual synchronization",
-                "Verify claims about location and time"
-            ]
-        }
-        return methods.get(content_type, methods["text"])
+        return _VERIFICATION_METHODS.get(content_type, _VERIFICATION_METHODS["text"])
     
     def generate_critical_questions(self, content):
         """Generate critical thinking questions"""
@@ -620,45 +724,15 @@ class KnowledgeAgent:
     
     def get_source_evaluation_guide(self):
         """Get guide for evaluating sources"""
-        return {
-            "credible_indicators": [
-                "Author expertise and credentials listed",
-                "Publication date clearly stated",
-                "Sources and references provided",
-                "Contact information available",
-                "Professional editorial standards",
-                "Transparent funding and ownership"
-            ],
-            "red_flag_indicators": [
-                "Anonymous or unknown authors",
-                "No publication date or sources",
-                "Sensational headlines or language",
-                "Poor grammar and spelling",
-                "Obvious bias or agenda",
-                "Requests for money or personal information"
-            ]
-        }
+        return dict(_SOURCE_EVALUATION_GUIDE)
     
-    def create_learning_resources(self, patterns):
+    def create_learning_resources(self, pattern_types):
         """Create additional learning resources"""
-        resources = []
-        
-        for pattern in patterns:
-            pattern_type = pattern.get("type")
-            if pattern_type == "statistical_manipulation":
-                resources.append({
-                    "title": "Understanding Statistical Manipulation",
-                    "type": "guide",
-                    "content": "Learn how statistics can be misleading and how to spot manipulation"
-                })
-            elif pattern_type == "emotional_manipulation":
-                resources.append({
-                    "title": "Recognizing Emotional Manipulation", 
-                    "type": "guide",
-                    "content": "Understand how emotions are used to bypass critical thinking"
-                })
-        
-        return resources
+        return [
+            dict(resource)
+            for pattern_type, resource in _LEARNING_RESOURCE_BY_TYPE.items()
+            if pattern_type in pattern_types
+        ]
 
 # Example usage
 if __name__ == "__main__":
@@ -4,11 +4,188 @@
 import os
 import sys
 import re
+import heapq
+import hashlib
+import threading
+from collections import OrderedDict
 from datetime import datetime
+from operator import itemgetter
+from types import MappingProxyType
 
 def get_current_time():
     return datetime.now().isoformat()
 
+# Interned fact-checking method names, shared by every target this agent emits
+_NEWS_SOURCES = sys.intern("news_sources")
+_GOVERNMENT = sys.intern("government")
+_ACADEMIC = sys.intern("academic")
+_FACT_CHECKERS = sys.intern("fact_checkers")
+_SOCIAL_MEDIA = sys.intern("social_media")
+
+# Keyword categories that route a claim to specific fact-checking methods
+_CHECK_METHOD_CATEGORIES = (
+    ("health", ("health", "medical", "vaccine", "disease", "drug"), (_GOVERNMENT, _ACADEMIC)),
+    ("political", ("government", "election", "policy", "president", "minister"), (_GOVERNMENT, _FACT_CHECKERS)),
+    ("scientific", ("study", "research", "scientists", "discovery"), (_ACADEMIC, _FACT_CHECKERS))
+)
+
+# One alternation over every category; a single pass over the claim reports all category hits.
+# Keywords match as substrings ("vaccines", "researchers"), and the lookahead consumes nothing
+# so a keyword overlapping another category's keyword is still found
+_CHECK_METHOD_RE = re.compile(
+    r"(?=(?:"
+    + "|".join(f"(?P<{name}>{'|'.join(map(re.escape, keywords))})" for name, keywords, _ in _CHECK_METHOD_CATEGORIES)
+    + r"))"
+)
+_CHECK_METHODS_BY_GROUP = {
+    _CHECK_METHOD_RE.groupindex[name]: methods for name, _, methods in _CHECK_METHOD_CATEGORIES
+}
+
+# Content categories for context analysis
+_CONTENT_CATEGORIES = MappingProxyType({
+    "health": ("vaccine", "medicine", "cure", "treatment", "disease", "virus", "covid", "cancer"),
+    "political": ("election", "government", "politician", "vote", "policy", "president", "minister"),
+    "scientific": ("study", "research", "scientist", "discovery", "breakthrough", "experiment"),
+    "financial": ("stock", "market", "economy", "investment", "crypto", "bitcoin", "money"),
+    "social": ("facebook", "twitter", "viral", "trending", "social media", "influencer"),
+    "emergency": ("breaking", "urgent", "alert", "crisis", "disaster", "emergency")
+})
+
+# Priority boost for content whose top category is one of these
+_CATEGORY_PRIORITIES = {
+    "health": 0.3,
+    "political": 0.25,
+    "emergency": 0.4,
+    "scientific": 0.2
+}
+
+# Inverted index: each category keyword maps to the category it belongs to
+_CATEGORY_BY_KEYWORD = {
+    keyword: category for category, keywords in _CONTENT_CATEGORIES.items() for keyword in keywords
+}
+
+# Whole words that are reported as topics in their own right
+_COMMON_TOPICS = frozenset({"covid", "vaccine", "election", "climate", "economy", "technology", "health"})
+
+# Keyword lists for sentiment, urgency and viral potential
+_POSITIVE_WORDS = ("good", "great", "excellent", "amazing", "wonderful", "breakthrough", "success")
+_NEGATIVE_WORDS = ("bad", "terrible", "awful", "disaster", "crisis", "failure", "dangerous")
+_URGENT_KEYWORDS = ("breaking", "urgent", "now", "immediate", "alert", "emergency")
+_EMOTIONAL_WORDS = ("shocking", "amazing", "unbelievable", "incredible", "outrageous")
+_SHARE_PHRASES = ("you won't believe", "share if you agree", "tag someone", "must see")
+_CONTROVERSIAL_TOPICS = ("vaccine", "election", "celebrity", "government")
+
+# Red flags as (pattern, type, regex). Literal phrases have no regex and are matched with the
+# shared keyword scan; only the numeric statistic needs a compiled pattern. The lookbehind
+# anchors it to the first digit of a number: unanchored, a search retries from every digit
+# and backtracks over the rest, which is quadratic on long digit runs in user content
+_RED_FLAG_PATTERNS = (
+    ("doctors hate this", "clickbait_medical", None),
+    ("they don't want you to know", "conspiracy", None),
+    ("100% natural", "unsubstantiated_claim", None),
+    ("miracle cure", "false_medical", None),
+    ("big pharma", "conspiracy_theory", None),
+    (r"\d+% effective", "unverified_statistic", re.compile(r"(?<!\d)\d+% effective")),
+    ("leaked documents", "unverified_source", None),
+    ("exclusive footage", "sensational_claim", None)
+)
+
+# Severity of each red flag type; unknown types are low
+_SEVERITY_MAP = {
+    "false_medical": "high",
+    "conspiracy_theory": "high",
+    "unverified_statistic": "medium",
+    "clickbait_medical": "medium",
+    "conspiracy": "medium",
+    "unsubstantiated_claim": "medium",
+    "unverified_source": "low",
+    "sensational_claim": "low"
+}
+
+# Every distinct context keyword, checked once per text instead of once per analyzer
+_CONTEXT_KEYWORDS = tuple(
+    {keyword for keywords in _CONTENT_CATEGORIES.values() for keyword in keywords}.union(
+        _POSITIVE_WORDS, _NEGATIVE_WORDS, _URGENT_KEYWORDS,
+        _EMOTIONAL_WORDS, _SHARE_PHRASES, _CONTROVERSIAL_TOPICS,
+        (pattern for pattern, _, regex in _RED_FLAG_PATTERNS if regex is None)
+    )
+)
+
+# Keyword hits of recently scanned texts, least recently used first. Reposted and quoted
+# content repeats verbatim; entries are keyed by a 16-byte digest so the texts themselves
+# are never kept alive, and the hash costs a fraction of the scan it replaces
+_SCAN_CACHE_SIZE = 4096
+_scan_cache = OrderedDict()
+_scan_cache_lock = threading.Lock()
+
+def _scan_context_keywords(text_lower):
+    """Return the set of context keywords occurring in lowercased text"""
+    key = hashlib.blake2b(text_lower.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    with _scan_cache_lock:
+        keyword_hits = _scan_cache.get(key)
+        if keyword_hits is not None:
+            _scan_cache.move_to_end(key)
+            return keyword_hits
+    
+    # Substring search runs in C; for a vocabulary this size it beats a regex alternation pass.
+    # Frozen so cached hits can be shared
+    keyword_hits = frozenset(keyword for keyword in _CONTEXT_KEYWORDS if keyword in text_lower)
+    with _scan_cache_lock:
+        _scan_cache[key] = keyword_hits
+        if len(_scan_cache) > _SCAN_CACHE_SIZE:
+            _scan_cache.popitem(last=False)
+    return keyword_hits
+
+# Tone patterns, compiled once. Each pattern is searched separately: CPython's re has no
+# multi-literal prefilter, so one named-group alternation scanned with finditer measured
+# several times slower than these short-circuiting searches
+_URGENT_TONE_PATTERNS = tuple(map(re.compile, (r'\b(urgent|breaking|alert|immediate)\b', r'!!+', r'\bNOW\b')))
+_FORMAL_TONE_PATTERNS = tuple(map(re.compile, (r'\b(according to|research shows|study finds)\b',)))
+_SENSATIONAL_TONE_PATTERNS = tuple(map(re.compile, (r'\b(shocking|amazing|incredible|unbelievable)\b', r'YOU WON\'T BELIEVE')))
+
+# Deletion tables that leave only uppercase / alphabetic ASCII characters, so counting them
+# is a single C-level translate instead of a Python loop per character
+_ASCII_CHARS = "".join(map(chr, range(128)))
+_DELETE_NON_UPPER = str.maketrans("", "", "".join(char for char in _ASCII_CHARS if not char.isupper()))
+_DELETE_NON_ALPHA = str.maketrans("", "", "".join(char for char in _ASCII_CHARS if not char.isalpha()))
+
+# Sentences are the runs between terminators; runs of 20 characters or fewer can never
+# pass the claim length check, so the pattern skips them without creating strings
+_SENTENCE_RE = re.compile(r'[^.!?]{21,}')
+
+# Claim confidence patterns. As with tone, separate compiled searches measured faster per
+# sentence than factual/opinion alternations scanned with finditer. Numeric patterns only
+# start at the first digit of a number (see _RED_FLAG_PATTERNS)
+_FACTUAL_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?<!\d)\d+%', r'(?<!\d)\d+ (people|cases|studies|times)',
+    r'(study|research) (shows|finds|reveals)',
+    r'according to', r'scientists (say|found|discovered)'
+))
+_OPINION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'I think', r'in my opinion', r'I believe', r'seems like'
+))
+
+# Claim types in precedence order. Keywords match as substrings so inflections such as
+# "researchers" or "studies" still classify; a token set would miss them
+_CLAIM_TYPE_KEYWORDS = (
+    ("scientific", ("study", "research", "scientist", "experiment")),
+    ("medical", ("vaccine", "medicine", "treatment", "health")),
+    ("political", ("election", "government", "politician", "policy")),
+    ("statistical", ("%", "percent", "statistics", "data"))
+)
+
+# Priority boost per claim type
+_TYPE_WEIGHTS = {
+    "medical": 0.3,
+    "scientific": 0.25,
+    "political": 0.2,
+    "statistical": 0.15,
+    "general": 0.1
+}
+
+_NUMBER_RE = re.compile(r'\d+')
+_URL_RE = re.compile(r'https?://')
+
 class PreprocessingContextAgent:
     """
     Preprocessing and Context Agent
@@ -16,28 +193,32 @@ class PreprocessingContextAgent:
     Extracts claims, analyzes context, determines priority
     """
     
+    __slots__ = ("name",)
+    
+    # Context analysis settings, shared by every instance
+    max_context_length = 1000
+    min_claim_confidence = 0.3
+    
+    # Content categories for context analysis
+    content_categories = _CONTENT_CATEGORIES
+    
     def __init__(self):
         self.name = "preprocessing_context_agent"
         
-        # Context analysis settings
-        self.max_context_length = 1000
-        self.min_claim_confidence = 0.3
-        
-        # Content categories for context analysis
-        self.content_categories = {
-            "health": ["vaccine", "medicine", "cure", "treatment", "disease", "virus", "covid", "cancer"],
-            "political": ["election", "government", "politician", "vote", "policy", "president", "minister"],
-            "scientific": ["study", "research", "scientist", "discovery", "breakthrough", "experiment"],
-            "financial": ["stock", "market", "economy", "investment", "crypto", "bitcoin", "money"],
-            "social": ["facebook", "twitter", "viral", "trending", "social media", "influencer"],
-            "emergency": ["breaking", "urgent", "alert", "crisis", "disaster", "emergency"]
-        }
-        
     def __call__(self, input_data):
         return self.process(input_data)
     
     def process(self, input_data):
         """Main preprocessing and context analysis"""
+        return self._process_one(input_data, get_current_time())
+    
+    def process_batch(self, batch):
+        """Preprocess several inputs, sharing one timestamp across the batch"""
+        now = get_current_time()
+        return [self._process_one(input_data, now) for input_data in batch]
+    
+    def _process_one(self, input_data, now):
+        """Build the preprocessing response for a single input"""
         # Handle different input formats from content intake agent
         if "processed_content" in input_data:
             processed_content = input_data["processed_content"]
@@ -56,17 +237,17 @@ class PreprocessingContextAgent:
             # Extract claims for fact-checking
             extracted_claims = self.extract_claims(processed_content, context_analysis)
             
-            # Calculate priorities
-            prioritized_claims = self.calculate_priorities(extracted_claims, context_analysis)
-            
-            # Filter claims by confidence threshold
+            # Filter claims by confidence threshold before scoring, so only valid claims are prioritized
             valid_claims = [
-                claim for claim in prioritized_claims 
+                claim for claim in extracted_claims 
                 if claim.get("confidence", 0) >= self.min_claim_confidence
             ]
             
+            # Calculate priorities, kept parallel to valid_claims instead of copied into each claim
+            priorities = self._priority_scores(valid_claims, context_analysis)
+            
             # Prepare fact-check targets
-            fact_check_targets = self.prepare_fact_check_targets(valid_claims)
+            fact_check_targets = self.prepare_fact_check_targets(valid_claims, priorities)
             
             return {
                 "status": "completed",
@@ -78,14 +259,14 @@ class PreprocessingContextAgent:
                 "content_insights": context_analysis.get("insights", []),
                 "recommended_checks": context_analysis.get("recommended_checks", []),
                 "priority_score": context_analysis.get("priority_score", 0.5),
-                "timestamp": get_current_time()
+                "timestamp": now
             }
             
         except Exception as e:
             return {
                 "status": "error",
                 "error": str(e),
-                "timestamp": get_current_time()
+                "timestamp": now
             }
     
     def analyze_context(self, processed_content, content_type, raw_content=""):
@@ -103,22 +284,30 @@ class PreprocessingContextAgent:
         if not text_content:
             text_content = raw_content
         
+        # Nothing to analyze; skip the analyzers and return their defaults directly
+        if not text_content:
+            return self.empty_context(content_type, metadata)
+        
+        # Lowercase once and scan once for every keyword the analyzers below look for
+        text_lower = text_content.lower()
+        keyword_hits = _scan_context_keywords(text_lower)
+        
         # Categorize content
-        categories = self.categorize_content(text_content)
+        categories = self.categorize_content(text_content, keyword_hits)
         
         # Detect sentiment and tone
-        sentiment = self.detect_sentiment(text_content)
-        tone = self.detect_tone(text_content)
+        sentiment = self.detect_sentiment(text_content, keyword_hits)
+        tone = self.detect_tone(text_content, text_lower)
         
         # Identify red flags
-        red_flags = self.identify_red_flags(text_content)
+        red_flags = self.identify_red_flags(text_content, keyword_hits, text_lower)
         
         # Calculate urgency and viral potential
-        urgency_score = self.calculate_urgency_score(text_content, metadata)
-        viral_potential = self.assess_viral_potential(text_content, metadata)
+        urgency_score = self.calculate_urgency_score(text_content, metadata, keyword_hits)
+        viral_potential = self.assess_viral_potential(text_content, metadata, keyword_hits)
         
         # Extract key topics
-        topics = self.extract_topics(text_content)
+        topics = self.extract_topics(text_content, keyword_hits, text_lower)
         
         return {
             "content_type": content_type,
@@ -131,8 +320,8 @@ class PreprocessingContextAgent:
             "topics": topics,
             "metadata": {
                 "word_count": len(text_content.split()) if text_content else 0,
-                "has_numbers": bool(re.search(r'\d+', text_content)),
-                "has_urls": bool(re.search(r'https?://', text_content)),
+                "has_numbers": bool(_NUMBER_RE.search(text_content)),
+                "has_urls": bool(_URL_RE.search(text_content)),
                 "all_caps_ratio": self.calculate_caps_ratio(text_content),
                 **metadata
             },
@@ -141,13 +330,44 @@ class PreprocessingContextAgent:
             "priority_score": self.calculate_content_priority(categories, red_flags, urgency_score)
         }
     
-    def categorize_content(self, text):
+    def empty_context(self, content_type, metadata):
+        """Context analysis result for empty content"""
+        return {
+            "content_type": content_type,
+            "categories": [],
+            "sentiment": "neutral",
+            "tone": "informal",
+            "red_flags": [],
+            "urgency_score": 0.0,
+            "viral_potential": 0.0,
+            "topics": [],
+            "metadata": {
+                "word_count": 0,
+                "has_numbers": False,
+                "has_urls": False,
+                "all_caps_ratio": 0.0,
+                **metadata
+            },
+            "insights": [],
+            "recommended_checks": ["standard_verification"],
+            "priority_score": 0.5
+        }
+    
+    def categorize_content(self, text, keyword_hits=None):
         """Categorize content based on keywords"""
         categories = []
-        text_lower = text.lower()
+        if keyword_hits is None:
+            keyword_hits = _scan_context_keywords(text.lower())
+        
+        # Count hits per category by looking up only the keywords that were found
+        category_counts = {}
+        for keyword in keyword_hits:
+            category = _CATEGORY_BY_KEYWORD.get(keyword)
+            if category is not None:
+                category_counts[category] = category_counts.get(category, 0) + 1
         
         for category, keywords in self.content_categories.items():
-            keyword_count = sum(1 for keyword in keywords if keyword in text_lower)
+            keyword_count = category_counts.get(category, 0)
             if keyword_count > 0:
                 categories.append({
                     "category": category,
@@ -155,16 +375,18 @@ class PreprocessingContextAgent:
                     "keywords_found": keyword_count
                 })
         
-        return sorted(categories, key=lambda x: x["relevance"], reverse=True)
+        # The full ranking is part of the output (claim context), so sort in place rather than select
+        categories.sort(key=itemgetter("relevance"), reverse=True)
+        return categories
     
-    def detect_sentiment(self, text):
+    def detect_sentiment(self, text, keyword_hits=None):
         """Simple sentiment analysis"""
-        positive_words = ["good", "great", "excellent", "amazing", "wonderful", "breakthrough", "success"]
-        negative_words = ["bad", "terrible", "awful", "disaster", "crisis", "failure", "dangerous"]
+        if keyword_hits is None:
+            keyword_hits = _scan_context_keywords(text.lower())
         
-        text_lower = text.lower()
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
+        # Count distinct words present; the intersection runs in C without a Python generator
+        positive_count = len(keyword_hits.intersection(_POSITIVE_WORDS))
+        negative_count = len(keyword_hits.intersection(_NEGATIVE_WORDS))
         
         if positive_count > negative_count:
             return "positive"
@@ -173,17 +395,14 @@ class PreprocessingContextAgent:
         else:
             return "neutral"
     
-    def detect_tone(self, text):
+    def detect_tone(self, text, text_lower=None):
         """Detect tone of content"""
-        urgent_patterns = [r'\b(urgent|breaking|alert|immediate)\b', r'!!+', r'\bNOW\b']
-        formal_patterns = [r'\b(according to|research shows|study finds)\b']
-        sensational_patterns = [r'\b(shocking|amazing|incredible|unbelievable)\b', r'YOU WON\'T BELIEVE']
+        if text_lower is None:
+            text_lower = text.lower()
         
-        text_lower = text.lower()
-        
-        urgent_score = sum(1 for pattern in urgent_patterns if re.search(pattern, text_lower))
-        formal_score = sum(1 for pattern in formal_patterns if re.search(pattern, text_lower))
-        sensational_score = sum(1 for pattern in sensational_patterns if re.search(pattern, text_lower))
+        urgent_score = sum(1 for pattern in _URGENT_TONE_PATTERNS if pattern.search(text_lower))
+        formal_score = sum(1 for pattern in _FORMAL_TONE_PATTERNS if pattern.search(text_lower))
+        sensational_score = sum(1 for pattern in _SENSATIONAL_TONE_PATTERNS if pattern.search(text_lower))
         
         if sensational_score > max(urgent_score, formal_score):
             return "sensational"
@@ -194,47 +413,29 @@ class PreprocessingContextAgent:
         else:
             return "informal"
     
-    def identify_red_flags(self, text):
+    def identify_red_flags(self, text, keyword_hits=None, text_lower=None):
         """Identify potential misinformation red flags"""
-        red_flag_patterns = [
-            {"pattern": r"doctors hate this", "type": "clickbait_medical"},
-            {"pattern": r"they don't want you to know", "type": "conspiracy"},
-            {"pattern": r"100% natural", "type": "unsubstantiated_claim"},
-            {"pattern": r"miracle cure", "type": "false_medical"},
-            {"pattern": r"big pharma", "type": "conspiracy_theory"},
-            {"pattern": r"\d+% effective", "type": "unverified_statistic"},
-            {"pattern": r"leaked documents", "type": "unverified_source"},
-            {"pattern": r"exclusive footage", "type": "sensational_claim"}
-        ]
-        
         red_flags = []
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
+        if keyword_hits is None:
+            keyword_hits = _scan_context_keywords(text_lower)
         
-        for flag_info in red_flag_patterns:
-            if re.search(flag_info["pattern"], text_lower):
+        for pattern, flag_type, regex in _RED_FLAG_PATTERNS:
+            if regex.search(text_lower) if regex else pattern in keyword_hits:
                 red_flags.append({
-                    "type": flag_info["type"],
-                    "pattern": flag_info["pattern"],
-                    "severity": self.get_flag_severity(flag_info["type"])
+                    "type": flag_type,
+                    "pattern": pattern,
+                    "severity": self.get_flag_severity(flag_type)
                 })
         
         return red_flags
     
     def get_flag_severity(self, flag_type):
         """Get severity level for different red flag types"""
-        severity_map = {
-            "false_medical": "high",
-            "conspiracy_theory": "high",
-            "unverified_statistic": "medium",
-            "clickbait_medical": "medium",
-            "conspiracy": "medium",
-            "unsubstantiated_claim": "medium",
-            "unverified_source": "low",
-            "sensational_claim": "low"
-        }
-        return severity_map.get(flag_type, "low")
+        return _SEVERITY_MAP.get(flag_type, "low")
     
-    def calculate_urgency_score(self, text, metadata):
+    def calculate_urgency_score(self, text, metadata, keyword_hits=None):
         """Calculate urgency score based on content and metadata"""
         urgency_score = 0.0
         
@@ -245,64 +446,63 @@ class PreprocessingContextAgent:
                 urgency_score += urgency_indicators.get("score", 0) * 0.5
         
         # Check for time-sensitive keywords
-        urgent_keywords = ["breaking", "urgent", "now", "immediate", "alert", "emergency"]
-        text_lower = text.lower()
-        for keyword in urgent_keywords:
-            if keyword in text_lower:
+        if keyword_hits is None:
+            keyword_hits = _scan_context_keywords(text.lower())
+        for keyword in _URGENT_KEYWORDS:
+            if keyword in keyword_hits:
                 urgency_score += 0.15
         
         return min(urgency_score, 1.0)
     
-    def assess_viral_potential(self, text, metadata):
+    def assess_viral_potential(self, text, metadata, keyword_hits=None):
         """Assess potential for content to go viral"""
         viral_indicators = 0.0
-        text_lower = text.lower()
+        if keyword_hits is None:
+            keyword_hits = _scan_context_keywords(text.lower())
         
         # Emotional content
-        emotional_words = ["shocking", "amazing", "unbelievable", "incredible", "outrageous"]
-        emotional_score = sum(1 for word in emotional_words if word in text_lower)
+        emotional_score = len(keyword_hits.intersection(_EMOTIONAL_WORDS))
         viral_indicators += min(emotional_score * 0.1, 0.3)
         
         # Share-worthy phrases
-        share_phrases = ["you won't believe", "share if you agree", "tag someone", "must see"]
-        for phrase in share_phrases:
-            if phrase in text_lower:
+        for phrase in _SHARE_PHRASES:
+            if phrase in keyword_hits:
                 viral_indicators += 0.2
         
         # Controversy potential
-        controversial_topics = ["vaccine", "election", "celebrity", "government"]
-        for topic in controversial_topics:
-            if topic in text_lower:
+        for topic in _CONTROVERSIAL_TOPICS:
+            if topic in keyword_hits:
                 viral_indicators += 0.1
         
         return min(viral_indicators, 1.0)
     
-    def extract_topics(self, text):
+    def extract_topics(self, text, keyword_hits=None, text_lower=None):
         """Extract main topics from content"""
-        topics = []
+        if text_lower is None:
+            text_lower = text.lower()
+        if keyword_hits is None:
+            keyword_hits = _scan_context_keywords(text_lower)
         
-        # Check against content categories
-        for category, keywords in self.content_categories.items():
-            if any(keyword in text.lower() for keyword in keywords):
-                topics.append(category)
-        
-        # Extract entity-based topics (simple approach)
-        text_words = text.lower().split()
-        common_topics = ["covid", "vaccine", "election", "climate", "economy", "technology", "health"]
+        # Check against content categories, in category order
+        hit_categories = {_CATEGORY_BY_KEYWORD.get(keyword) for keyword in keyword_hits}
+        topics = dict.fromkeys(category for category in _CONTENT_CATEGORIES if category in hit_categories)
         
-        for topic in common_topics:
-            if topic in text_words:
-                topics.append(topic)
+        # Extract entity-based topics (simple approach), in text order
+        topics.update(dict.fromkeys(word for word in text_lower.split() if word in _COMMON_TOPICS))
         
-        return list(set(topics))[:5]  # Return unique topics, max 5
+        return list(topics)[:5]  # Return unique topics in first-seen order, max 5
     
     def calculate_caps_ratio(self, text):
         """Calculate ratio of capital letters"""
         if not text:
             return 0.0
         
-        caps_count = sum(1 for char in text if char.isupper())
-        total_letters = sum(1 for char in text if char.isalpha())
+        if text.isascii():
+            caps_count = len(text.translate(_DELETE_NON_UPPER))
+            total_letters = len(text.translate(_DELETE_NON_ALPHA))
+        else:
+            caps_count = sum(map(str.isupper, text))
+            total_letters = sum(map(str.isalpha, text))
         
         return caps_count / total_letters if total_letters > 0 else 0.0
     
@@ -328,12 +528,10 @@ class PreprocessingContextAgent:
                         "type": self.classify_claim_type(claim.get("text", "")),
                         "context": context_analysis.get("categories", [])
                     })
-        else:
-            # Extract claims from text
-            sentences = re.split(r'[.!?]+', text_content)
-            
-            for sentence in sentences:
-                sentence = sentence.strip()
+        elif len(text_content) > 20:
+            # Extract claims from text (shorter text cannot hold a sentence long enough to be a claim)
+            for match in _SENTENCE_RE.finditer(text_content):
+                sentence = match.group().strip()
                 if len(sentence) > 20:  # Skip short sentences
                     claim_confidence = self.assess_claim_confidence(sentence)
                     if claim_confidence >= 0.3:  # Minimum threshold
@@ -350,75 +548,65 @@ class PreprocessingContextAgent:
         """Classify the type of claim"""
         text_lower = claim_text.lower()
         
-        if any(word in text_lower for word in ["study", "research", "scientist", "experiment"]):
-            return "scientific"
-        elif any(word in text_lower for word in ["vaccine", "medicine", "treatment", "health"]):
-            return "medical"
-        elif any(word in text_lower for word in ["election", "government", "politician", "policy"]):
-            return "political"
-        elif any(word in text_lower for word in ["%", "percent", "statistics", "data"]):
-            return "statistical"
-        else:
-            return "general"
+        for claim_type, keywords in _CLAIM_TYPE_KEYWORDS:
+            if any(word in text_lower for word in keywords):
+                return claim_type
+        return "general"
     
     def assess_claim_confidence(self, claim_text):
         """Assess confidence that this is a factual claim"""
         confidence = 0.3  # Base confidence
         
         # Factual indicators
-        factual_patterns = [
-            r'\d+%', r'\d+ (people|cases|studies|times)',
-            r'(study|research) (shows|finds|reveals)',
-            r'according to', r'scientists (say|found|discovered)'
-        ]
-        
-        for pattern in factual_patterns:
-            if re.search(pattern, claim_text, re.IGNORECASE):
+        for pattern in _FACTUAL_PATTERNS:
+            if pattern.search(claim_text):
                 confidence += 0.2
         
         # Reduce confidence for opinion indicators
-        opinion_patterns = [r'I think', r'in my opinion', r'I believe', r'seems like']
-        for pattern in opinion_patterns:
-            if re.search(pattern, claim_text, re.IGNORECASE):
+        for pattern in _OPINION_PATTERNS:
+            if pattern.search(claim_text):
                 confidence -= 0.3
         
         return max(0.1, min(1.0, confidence))
     
     def calculate_priorities(self, claims, context_analysis):
         """Calculate priority scores for claims"""
-        prioritized_claims = []
+        prioritized_claims = [
+            {**claim, "priority": priority}
+            for claim, priority in zip(claims, self._priority_scores(claims, context_analysis))
+        ]
+        prioritized_claims.sort(key=itemgetter("priority"), reverse=True)
+        return prioritized_claims
+    
+    def _priority_scores(self, claims, context_analysis):
+        """Calculate priority scores for claims, in the same order as the claims"""
+        context_boosts = self.calculate_context_boosts(context_analysis)
         
-        for claim in claims:
-            priority_score = self.calculate_claim_priority(claim, context_analysis)
-            prioritized_claim = claim.copy()
-            prioritized_claim["priority"] = priority_score
-            prioritized_claims.append(prioritized_claim)
+        return [self.calculate_claim_priority(claim, context_analysis, context_boosts) for claim in claims]
+    
+    def calculate_context_boosts(self, context_analysis):
+        """Calculate the content-wide urgency and red flag priority boosts"""
+        # Boost priority for urgent content
+        urgency_boost = context_analysis.get("urgency_score", 0) * 0.2
         
-        return sorted(prioritized_claims, key=lambda x: x["priority"], reverse=True)
+        # Boost priority for content with red flags
+        red_flags = context_analysis.get("red_flags", [])
+        high_severity_count = sum(1 for flag in red_flags if flag.get("severity") == "high")
+        
+        return urgency_boost, high_severity_count * 0.1
     
-    def calculate_claim_priority(self, claim, context_analysis):
+    def calculate_claim_priority(self, claim, context_analysis, context_boosts=None):
         """Calculate priority score for individual claim"""
         priority = claim.get("confidence", 0.5)  # Start with confidence
         
         # Boost priority based on claim type
         claim_type = claim.get("type", "general")
-        type_weights = {
-            "medical": 0.3,
-            "scientific": 0.25,
-            "political": 0.2,
-            "statistical": 0.15,
-            "general": 0.1
-        }
-        priority += type_weights.get(claim_type, 0.1)
-        
-        # Boost priority for urgent content
-        urgency_score = context_analysis.get("urgency_score", 0)
-        priority += urgency_score * 0.2
+        priority += _TYPE_WEIGHTS.get(claim_type, 0.1)
         
-        # Boost priority for content with red flags
-        red_flags = context_analysis.get("red_flags", [])
-        high_severity_flags = [flag for flag in red_flags if flag.get("severity") == "high"]
-        priority += len(high_severity_flags) * 0.1
+        # Urgency and red flag boosts are shared by every claim of the same content
+        urgency_boost, red_flag_boost = context_boosts or self.calculate_context_boosts(context_analysis)
+        priority += urgency_boost
+        priority += red_flag_boost
         
         return min(priority, 1.0)
     
@@ -457,7 +645,7 @@ class PreprocessingContextAgent:
         if red_flags:
             checks.append("enhanced_scrutiny")
         
-        return list(set(checks))
+        return list(dict.fromkeys(checks))
     
     def calculate_content_priority(self, categories, red_flags, urgency_score):
         """Calculate overall content priority for processing"""
@@ -465,14 +653,8 @@ class PreprocessingContextAgent:
         
         # Category-based priority
         if categories:
-            category_priorities = {
-                "health": 0.3,
-                "political": 0.25,
-                "emergency": 0.4,
-                "scientific": 0.2
-            }
             top_category = categories[0]["category"]
-            priority += category_priorities.get(top_category, 0.1)
+            priority += _CATEGORY_PRIORITIES.get(top_category, 0.1)
         
         # Red flag impact
         priority += len(red_flags) * 0.1
@@ -482,16 +664,20 @@ class PreprocessingContextAgent:
         
         return min(priority, 1.0)
     
-    def prepare_fact_check_targets(self, prioritized_claims):
+    def prepare_fact_check_targets(self, claims, priorities):
         """Prepare claims for fact-checking agent"""
         targets = []
         
-        for i, claim in enumerate(prioritized_claims[:10]):  # Limit to top 10
+        # Select the top 10 claim indices by priority without sorting the rest
+        top_indices = heapq.nlargest(10, range(len(claims)), key=priorities.__getitem__)
+        
+        for i, index in enumerate(top_indices):
+            claim = claims[index]
             target = {
                 "claim_id": i + 1,
                 "claim_text": claim.get("text"),
                 "claim_type": claim.get("type"),
-                "priority": claim.get("priority", 0.5),
+                "priority": priorities[index],
                 "confidence": claim.get("confidence", 0.5),
                 "check_methods": self.determine_check_methods(claim),
                 "context": claim.get("context", ""),
@@ -503,34 +689,22 @@ class PreprocessingContextAgent:
     
     def determine_check_methods(self, claim):
         """Determine appropriate fact-checking methods for a claim"""
-        methods = []
-        claim_type = claim.get("type", "general")
-        claim_text = claim.get("text", "").lower()
-        
         # Always check news sources
-        methods.append("news_sources")
-        
-        # Health-related claims
-        if any(keyword in claim_text for keyword in ["health", "medical", "vaccine", "disease", "drug"]):
-            methods.extend(["government", "academic"])
-        
-        # Political claims
-        if any(keyword in claim_text for keyword in ["government", "election", "policy", "president", "minister"]):
-            methods.extend(["government", "fact_checkers"])
+        methods = [_NEWS_SOURCES]
         
-        # Scientific claims
-        if any(keyword in claim_text for keyword in ["study", "research", "scientists", "discovery"]):
-            methods.extend(["academic", "fact_checkers"])
+        # Health, political and scientific claims
+        for match in _CHECK_METHOD_RE.finditer(claim.get("text", "").lower()):
+            methods.extend(_CHECK_METHODS_BY_GROUP[match.lastindex])
         
         # Social media viral claims
         if claim.get("viral_potential", 0) > 0.7:
-            methods.append("social_media")
+            methods.append(_SOCIAL_MEDIA)
         
         # Breaking news
         if claim.get("urgency_level") == "high":
-            methods.extend(["fact_checkers", "social_media"])
+            methods.extend((_FACT_CHECKERS, _SOCIAL_MEDIA))
         
-        return list(set(methods))  # Remove duplicates
+        return list(dict.fromkeys(methods))
     
     def generate_context_summary(self, context_analysis):
         """Generate human-readable context summary"""
@@ -3,11 +3,48 @@
 
 from datetime import datetime, timedelta
 import re
-import hashlib
+import time
+import heapq
+import itertools
+import os
+import secrets
+from collections import OrderedDict
 
 def get_current_time():
     return datetime.now().isoformat()
 
+def truncate_text(text, limit):
+    """Return text cut to limit characters with an ellipsis, or unchanged if it fits"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+# Query and alert ID suffixes: a process tag plus a per-process sequence number,
+# unique without hashing and shared by every agent instance in the process. The tag
+# adds a random nonce to the PID, so containers that all run as PID 1 do not collide
+# and IDs cannot be guessed. Forked workers get a fresh tag and sequence
+def _reset_id_state():
+    global _ID_SEQUENCE, _PROCESS_TAG
+    _ID_SEQUENCE = itertools.count()
+    _PROCESS_TAG = f"{os.getpid():x}{secrets.token_hex(4)}"
+
+_reset_id_state()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_state)
+
+# URL detector for content metadata, compiled once at import
+_URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+
+# Keyword lists for priority and metadata that are not configurable thresholds
+_CRITICAL_TOPICS = frozenset({"health", "vaccine", "election", "virus"})
+_FALSEHOOD_INDICATORS = frozenset({"false", "fake", "hoax", "conspiracy"})
+_MISINFORMATION_TERMS = ("vaccine", "election", "covid", "5g", "conspiracy", "fake", "hoax")
+
+# Hours a query may stay pending before it is reported overdue; other priorities get 72
+_OVERDUE_HOURS = {"critical": 2, "high": 24, "medium": 72}
+_MIN_OVERDUE_SECONDS = min(_OVERDUE_HOURS.values()) * 3600
+
+# Most urgent first; unknown priorities rank after all of these
+_PRIORITY_RANK = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
 class RealtimeAlertAgent:
     """
     Realtime Alert Agent
@@ -16,8 +53,18 @@ class RealtimeAlertAgent:
     
     def __init__(self):
         self.name = "realtime_alert_agent"
-        self.pending_queries = {}  # Store unsolved queries
+        self.pending_queries = OrderedDict()  # Store unsolved queries, least recently stored/updated first
+        self.max_pending_queries = 100000     # Least recently touched queries are evicted beyond this
+        self.query_heap = []       # (stored monotonic time, query_id), oldest first
+        self.query_word_sets = {}  # query_id -> words of the lowercased content, for resolution scoring
+        
+        # Secondary indexes: status / priority / user_id -> {query_id: None}, in insertion order
+        self.queries_by_status = {}
+        self.queries_by_priority = {}
+        self.queries_by_user = {}
+        self.queries_by_keyword = {}  # misinformation term in the query's metadata keywords
         self.alert_history = {}    # Track alert history
+        self.max_alert_history = 10000  # Oldest alerts are dropped beyond this
         self.notification_channels = {
             "email": True,
             "sms": False,
@@ -54,6 +101,26 @@ class RealtimeAlertAgent:
             r"update",
             r"clarification"
         ]
+        # Compiled once; every pending query is scored against new content with these
+        self._resolution_res = tuple(re.compile(pattern) for pattern in self.resolution_patterns)
+        
+        # Priority keyword sets; the hit set is tested against them smallest side first
+        self._urgent_keywords = frozenset(self.priority_thresholds["critical"]["urgent_keywords"])
+        self._sensitive_topics = frozenset(self.priority_thresholds["high"]["sensitive_topics"])
+        
+        # Every distinct keyword priority and metadata look for, so content is scanned once
+        self._content_keywords = tuple(self._urgent_keywords.union(
+            _CRITICAL_TOPICS, _FALSEHOOD_INDICATORS, self._sensitive_topics, _MISINFORMATION_TERMS
+        ))
+        
+        # Action name -> bound handler, resolved once instead of per request
+        self.action_handlers = {
+            "store_unsolved": self.store_unsolved_query,
+            "check_resolved": self.check_and_alert_resolved,
+            "create_alert": self.create_alert,
+            "get_pending": self.get_pending_queries,
+            "update_status": self.update_query_status
+        }
         
     def __call__(self, input_data):
         return self.process(input_data)
@@ -63,19 +130,10 @@ class RealtimeAlertAgent:
         action = input_data.get("action", "monitor")
         
         try:
-            if action == "store_unsolved":
-                return self.store_unsolved_query(input_data)
-            elif action == "check_resolved":
-                return self.check_and_alert_resolved(input_data)
-            elif action == "create_alert":
-                return self.create_alert(input_data)
-            elif action == "get_pending":
-                return self.get_pending_queries(input_data)
-            elif action == "update_status":
-                return self.update_query_status(input_data)
-            else:
-                return self.monitor_queries(input_data)
-                
+            # Unknown actions fall back to monitoring
+            handler = self.action_handlers.get(action, self.monitor_queries)
+            return handler(input_data)
+            
         except Exception as e:
             return {
                 "status": "error",
@@ -85,42 +143,63 @@ class RealtimeAlertAgent:
     
     def store_unsolved_query(self, input_data):
         """Store query that couldn't be resolved with enhanced metadata"""
-        query_id = input_data.get("query_id", self.generate_query_id(input_data))
+        now = get_current_time()
+        
+        # Only pay for ID generation when the caller did not supply one
+        query_id = input_data.get("query_id")
+        if query_id is None:
+            query_id = self.generate_query_id(input_data)
         user_id = input_data.get("user_id", "anonymous")
         content = input_data.get("content", "")
         content_type = input_data.get("content_type", "text")
         urgency_level = input_data.get("urgency_level", "medium")
         
-        # Calculate priority based on content analysis
-        priority = self.calculate_priority(content, content_type, urgency_level)
+        # Calculate priority based on content analysis, sharing one keyword scan with metadata
+        content_lower = content.lower()
+        keyword_hits = self.scan_keywords(content_lower)
+        priority = self.calculate_priority(content, content_type, urgency_level, keyword_hits)
         
         # Extract key metadata
-        metadata = self.extract_content_metadata(content, content_type)
+        metadata = self.extract_content_metadata(content, content_type, now, keyword_hits)
+        
+        # Storing an existing query ID again replaces it, so drop the old record from the indexes
+        previous = self.pending_queries.get(query_id)
+        if previous is not None:
+            self.unindex_query(query_id, previous)
+            self.pending_queries.move_to_end(query_id)
         
-        self.pending_queries[query_id] = {
+        stored_monotonic = time.monotonic()
+        query_data = self.pending_queries[query_id] = {
             "user_id": user_id,
             "content": content,
             "content_type": content_type,
             "priority": priority,
             "urgency_level": urgency_level,
             "metadata": metadata,
-            "stored_at": get_current_time(),
+            "stored_at": now,
+            "stored_at_monotonic": stored_monotonic,
             "status": "pending",
             "attempts": 0,
             "last_check": None,
             "notification_sent": False
         }
+        # Re-storing within the same clock tick would duplicate the live heap entry
+        if previous is None or previous["stored_at_monotonic"] != stored_monotonic:
+            heapq.heappush(self.query_heap, (stored_monotonic, query_id))
+        self.index_query(query_id, query_data)
+        self.query_word_sets[query_id] = frozenset(content_lower.split())
+        self.evict_excess_queries()
         
         # If critical priority, create immediate alert
         if priority == "critical":
-            alert_result = self.create_immediate_alert(query_id, content, metadata)
+            alert_result = self.create_immediate_alert(query_id, content, metadata, now)
             return {
                 "status": "stored_with_alert",
                 "query_id": query_id,
                 "priority": priority,
                 "alert_created": alert_result["alert_id"],
                 "message": f"Critical query stored and alert created",
-                "timestamp": get_current_time()
+                "timestamp": now
             }
         
         return {
@@ -129,29 +208,29 @@ class RealtimeAlertAgent:
             "priority": priority,
             "message": f"Query stored for monitoring with {priority} priority",
             "estimated_resolution_time": self.estimate_resolution_time(priority),
-            "timestamp": get_current_time()
+            "timestamp": now
         }
     
-    def calculate_priority(self, content, content_type, urgency_level):
+    def scan_keywords(self, content_lower):
+        """Return the set of priority and metadata keywords occurring in lowercased content"""
+        return frozenset(keyword for keyword in self._content_keywords if keyword in content_lower)
+    
+    def calculate_priority(self, content, content_type, urgency_level, keyword_hits=None):
         """Calculate priority level based on content analysis"""
-        content_lower = content.lower()
+        if keyword_hits is None:
+            keyword_hits = self.scan_keywords(content.lower())
         
-        # Critical priority checks
-        critical_thresholds = self.priority_thresholds["critical"]
-        
-        # Check for urgent keywords
-        for keyword in critical_thresholds["urgent_keywords"]:
-            if keyword in content_lower:
-                return "critical"
+        # Critical priority checks: urgent keywords
+        if not keyword_hits.isdisjoint(self._urgent_keywords):
+            return "critical"
         
         # Check content patterns
-        if any(pattern in content_lower for pattern in ["health", "vaccine", "election", "virus"]):
-            if any(indicator in content_lower for indicator in ["false", "fake", "hoax", "conspiracy"]):
+        if not keyword_hits.isdisjoint(_CRITICAL_TOPICS):
+            if not keyword_hits.isdisjoint(_FALSEHOOD_INDICATORS):
                 return "critical"
         
         # High priority checks  
-        high_thresholds = self.priority_thresholds["high"]
-        if any(topic in content_lower for topic in high_thresholds["sensitive_topics"]):
+        if not keyword_hits.isdisjoint(self._sensitive_topics):
             return "high"
         
         # Use provided urgency level as baseline
@@ -162,56 +241,69 @@ class RealtimeAlertAgent:
         
         return urgency_level
     
-    def extract_content_metadata(self, content, content_type):
+    def extract_content_metadata(self, content, content_type, now=None, keyword_hits=None):
         """Extract relevant metadata from content for monitoring"""
         metadata = {
             "word_count": len(content.split()) if content else 0,
             "char_count": len(content),
             "content_type": content_type,
-            "contains_urls": bool(re.search(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', content)),
+            "contains_urls": bool(_URL_RE.search(content)),
             "language_detected": "en",  # Simplified - in production would use language detection
-            "extracted_at": get_current_time()
+            "extracted_at": now or get_current_time()
         }
         
         # Extract potential entities or keywords
         if content:
             # Simple keyword extraction
-            keywords = []
-            common_misinformation_terms = ["vaccine", "election", "covid", "5g", "conspiracy", "fake", "hoax"]
-            for term in common_misinformation_terms:
-                if term in content.lower():
-                    keywords.append(term)
-            metadata["keywords"] = keywords
+            if keyword_hits is None:
+                keyword_hits = self.scan_keywords(content.lower())
+            metadata["keywords"] = [term for term in _MISINFORMATION_TERMS if term in keyword_hits]
         
         return metadata
     
     def check_and_alert_resolved(self, input_data):
         """Check if any pending queries can now be resolved and send alerts"""
         new_content = input_data.get("new_content", "")
+        now = get_current_time()
         resolved_queries = []
         alerts_created = []
         
-        # Check each pending query against new content
-        for query_id, query_data in list(self.pending_queries.items()):
-            if query_data["status"] != "pending":
-                continue
+        # The new content is the same for every query; lowercase, split and scan it once
+        new_content_features = self.extract_resolution_features(new_content)
+        
+        # A query that shares no misinformation term with the new content scores at most 0.6
+        # (patterns 0.3 + word overlap 0.3), below the threshold, so only pending queries in
+        # the keyword buckets of the new content's terms are scored
+        new_keywords = new_content_features[1]
+        pending_ids = self.queries_by_status.get("pending", {})
+        candidate_ids = dict.fromkeys(
+            query_id
+            for term in _MISINFORMATION_TERMS if term in new_keywords
+            for query_id in self.queries_by_keyword.get(term, ())
+            if query_id in pending_ids
+        )
+        
+        for query_id in candidate_ids:
+            query_data = self.pending_queries[query_id]
             
             # Check if new content might resolve this query
             resolution_score = self.calculate_resolution_score(
                 query_data["content"], 
                 new_content, 
-                query_data["metadata"]
+                query_data["metadata"],
+                new_content_features,
+                self.query_word_sets.get(query_id)
             )
             
             if resolution_score > 0.7:  # High confidence threshold
                 # Mark as potentially resolved
-                query_data["status"] = "potentially_resolved"
+                self.set_query_status(query_id, query_data, "potentially_resolved")
                 query_data["resolution_content"] = new_content
                 query_data["resolution_score"] = resolution_score
-                query_data["resolved_at"] = get_current_time()
+                query_data["resolved_at"] = now
                 
                 # Create alert for user
-                alert = self.create_resolution_alert(query_id, query_data, new_content)
+                alert = self.create_resolution_alert(query_id, query_data, new_content, now)
                 alerts_created.append(alert)
                 resolved_queries.append(query_id)
         
@@ -222,42 +314,60 @@ class RealtimeAlertAgent:
             "alerts_created": len(alerts_created),
             "resolved_query_ids": resolved_queries,
             "alert_details": alerts_created,
-            "timestamp": get_current_time()
+            "notification_batches": self.batch_alerts_by_user(alerts_created),
+            "timestamp": now
         }
     
-    def calculate_resolution_score(self, original_content, new_content, metadata):
+    def batch_alerts_by_user(self, alerts):
+        """Group alerts per user so each user is notified once per sweep"""
+        alerts_by_user = {}
+        for alert in alerts:
+            alerts_by_user.setdefault(alert["user_id"], []).append(alert)
+        
+        batches = []
+        for user_id, user_alerts in alerts_by_user.items():
+            # A batch goes out on the channels of its most urgent alert
+            top_priority = min((alert["priority"] for alert in user_alerts), key=lambda priority: _PRIORITY_RANK.get(priority, 4))
+            batches.append({
+                "user_id": user_id,
+                "alert_ids": [alert["alert_id"] for alert in user_alerts],
+                "batched": len(user_alerts) > 1,
+                "channels": self.get_notification_channels(top_priority)
+            })
+        
+        return batches
+    
+    def extract_resolution_features(self, new_content):
+        """Return (has resolution pattern, misinformation terms, word set) for new content"""
+        new_lower = new_content.lower()
+        
+        # Check for resolution patterns in new content; only whether any matches counts
+        has_resolution_pattern = any(pattern.search(new_lower) for pattern in self._resolution_res)
+        new_keywords = frozenset(term for term in _MISINFORMATION_TERMS if term in new_lower)
+        
+        return has_resolution_pattern, new_keywords, frozenset(new_lower.split())
+    
+    def calculate_resolution_score(self, original_content, new_content, metadata, new_content_features=None, original_words=None):
         """Calculate how likely the new content resolves the original query"""
         if not new_content or not original_content:
             return 0.0
         
         score = 0.0
-        original_lower = original_content.lower()
-        new_lower = new_content.lower()
-        
-        # Check for resolution patterns in new content
-        resolution_matches = 0
-        for pattern in self.resolution_patterns:
-            if re.search(pattern, new_lower):
-                resolution_matches += 1
+        if new_content_features is None:
+            new_content_features = self.extract_resolution_features(new_content)
+        has_resolution_pattern, new_keywords, new_words = new_content_features
         
-        if resolution_matches > 0:
+        if has_resolution_pattern:
             score += 0.3
         
         # Check for keyword overlap
-        original_keywords = set(metadata.get("keywords", []))
-        new_keywords = set()
-        common_terms = ["vaccine", "election", "covid", "5g", "conspiracy", "fake", "hoax"]
-        for term in common_terms:
-            if term in new_lower:
-                new_keywords.add(term)
-        
-        keyword_overlap = len(original_keywords.intersection(new_keywords))
+        keyword_overlap = len(new_keywords.intersection(metadata.get("keywords", [])))
         if keyword_overlap > 0:
             score += min(keyword_overlap * 0.2, 0.4)
         
         # Check for direct content similarity (simplified)
-        original_words = set(original_lower.split())
-        new_words = set(new_lower.split())
+        if original_words is None:
+            original_words = frozenset(original_content.lower().split())
         
         if len(original_words) > 0:
             word_overlap = len(original_words.intersection(new_words)) / len(original_words)
@@ -265,7 +375,7 @@ class RealtimeAlertAgent:
         
         return min(score, 1.0)
     
-    def create_resolution_alert(self, query_id, query_data, new_content):
+    def create_resolution_alert(self, query_id, query_data, new_content, now=None):
         """Create alert when a query is potentially resolved"""
         alert_id = self.generate_alert_id(query_id)
         
@@ -275,16 +385,16 @@ class RealtimeAlertAgent:
             "query_id": query_id,
             "user_id": query_data["user_id"],
             "priority": query_data["priority"],
-            "original_content": query_data["content"][:200] + "..." if len(query_data["content"]) > 200 else query_data["content"],
-            "resolution_content": new_content[:200] + "..." if len(new_content) > 200 else new_content,
+            "original_content": truncate_text(query_data["content"], 200),
+            "resolution_content": truncate_text(new_content, 200),
             "resolution_score": query_data.get("resolution_score", 0.0),
             "message": f"Your misinformation query may have been resolved. New information is available.",
             "action_required": "Please review the new information to confirm if your question has been answered.",
-            "created_at": get_current_time()
+            "created_at": now or get_current_time()
         }
         
         # Store in alert history
-        self.alert_history[alert_id] = alert
+        self.record_alert(alert_id, alert)
         
         # Mark notification as sent
         query_data["notification_sent"] = True
@@ -292,7 +402,7 @@ class RealtimeAlertAgent:
         
         return alert
     
-    def create_immediate_alert(self, query_id, content, metadata):
+    def create_immediate_alert(self, query_id, content, metadata, now=None):
         """Create immediate alert for critical queries"""
         alert_id = self.generate_alert_id(query_id, "critical")
         
@@ -301,14 +411,14 @@ class RealtimeAlertAgent:
             "type": "critical_query",
             "query_id": query_id,
             "priority": "critical",
-            "content_preview": content[:150] + "..." if len(content) > 150 else content,
+            "content_preview": truncate_text(content, 150),
             "keywords": metadata.get("keywords", []),
             "message": "Critical misinformation query detected and is being prioritized for fact-checking.",
             "estimated_response_time": "Within 2 hours",
-            "created_at": get_current_time()
+            "created_at": now or get_current_time()
         }
         
-        self.alert_history[alert_id] = alert
+        self.record_alert(alert_id, alert)
         return alert
     
     def create_alert(self, input_data):
@@ -317,48 +427,73 @@ class RealtimeAlertAgent:
         message = input_data.get("message", "New alert created")
         priority = input_data.get("priority", "medium")
         
-        alert_id = f"ALERT_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{priority.upper()}"
+        current = datetime.now()
+        now = current.isoformat()
+        alert_id = f"ALERT_{current.strftime('%Y%m%d_%H%M%S')}_{priority.upper()}"
         
         alert = {
             "alert_id": alert_id,
             "type": alert_type,
             "priority": priority,
             "message": message,
-            "created_at": get_current_time(),
+            "created_at": now,
             "channels": self.get_notification_channels(priority)
         }
         
-        self.alert_history[alert_id] = alert
+        self.record_alert(alert_id, alert)
         
         return {
             "status": "alert_created",
             "alert_id": alert_id,
             "alert": alert,
-            "timestamp": get_current_time()
+            "timestamp": now
         }
     
+    def record_alert(self, alert_id, alert):
+        """Store an alert in the bounded alert history"""
+        self.alert_history[alert_id] = alert
+        
+        # Dicts keep insertion order, so the first key is the oldest alert
+        if len(self.alert_history) > self.max_alert_history:
+            del self.alert_history[next(iter(self.alert_history))]
+    
     def get_pending_queries(self, input_data):
         """Get list of pending queries with filtering options"""
         priority_filter = input_data.get("priority_filter")
         user_filter = input_data.get("user_filter")
         status_filter = input_data.get("status_filter", "pending")
         
+        # Look up the index bucket of every active filter and walk the smallest one
+        buckets = [
+            index.get(value, {})
+            for index, value in (
+                (self.queries_by_priority, priority_filter),
+                (self.queries_by_user, user_filter),
+                (self.queries_by_status, status_filter)
+            )
+            if value
+        ]
+        if buckets:
+            buckets.sort(key=len)
+            candidate_ids = buckets[0]
+            other_buckets = buckets[1:]
+        else:
+            candidate_ids = self.pending_queries
+            other_buckets = []
+        
         filtered_queries = {}
-        for query_id, query_data in self.pending_queries.items():
-            include_query = True
-            
-            if priority_filter and query_data["priority"] != priority_filter:
-                include_query = False
-            if user_filter and query_data["user_id"] != user_filter:
-                include_query = False
-            if status_filter and query_data["status"] != status_filter:
-                include_query = False
-            
-            if include_query:
-                # Don't include full content in summary
-                summary_data = query_data.copy()
-                summary_data["content"] = query_data["content"][:100] + "..." if len(query_data["content"]) > 100 else query_data["content"]
-                filtered_queries[query_id] = summary_data
+        for query_id in candidate_ids:
+            if all(query_id in bucket for bucket in other_buckets):
+                query_data = self.pending_queries[query_id]
+                
+                # Summaries carry only the listing fields, and never the full content
+                filtered_queries[query_id] = {
+                    "user_id": query_data["user_id"],
+                    "priority": query_data["priority"],
+                    "status": query_data["status"],
+                    "stored_at": query_data["stored_at"],
+                    "content": truncate_text(query_data["content"], 100)
+                }
         
         return {
             "status": "success",
@@ -372,58 +507,49 @@ class RealtimeAlertAgent:
         """Update the status of a query"""
         query_id = input_data.get("query_id")
         new_status = input_data.get("status", "pending")
+        now = get_current_time()
         
-        if query_id not in self.pending_queries:
+        query_data = self.pending_queries.get(query_id)
+        if query_data is None:
             return {
                 "status": "error",
                 "message": "Query ID not found",
-                "timestamp": get_current_time()
+                "timestamp": now
             }
         
-        old_status = self.pending_queries[query_id]["status"]
-        self.pending_queries[query_id]["status"] = new_status
-        self.pending_queries[query_id]["last_updated"] = get_current_time()
+        old_status = query_data["status"]
+        self.set_query_status(query_id, query_data, new_status)
+        query_data["last_updated"] = now
         
         return {
             "status": "updated",
             "query_id": query_id,
             "old_status": old_status,
             "new_status": new_status,
-            "timestamp": get_current_time()
+            "timestamp": now
         }
     
     def monitor_queries(self, input_data):
         """Monitor and return comprehensive status of all queries"""
-        # Calculate statistics
+        # Calculate statistics; counts by status and priority are the index bucket sizes
         stats = {
             "total_queries": len(self.pending_queries),
-            "by_status": {},
-            "by_priority": {},
+            "by_status": {status: len(query_ids) for status, query_ids in self.queries_by_status.items()},
+            "by_priority": {priority: len(query_ids) for priority, query_ids in self.queries_by_priority.items()},
             "overdue_queries": []
         }
         
-        current_time = datetime.now()
+        current_time = time.monotonic()
         
-        for query_id, query_data in self.pending_queries.items():
-            # Count by status
-            status = query_data["status"]
-            stats["by_status"][status] = stats["by_status"].get(status, 0) + 1
-            
-            # Count by priority
+        # Queries stored within the shortest threshold cannot be overdue, so only the older
+        # ones are visited, oldest first
+        for query_id, query_data in self.iter_stored_before(current_time - _MIN_OVERDUE_SECONDS):
             priority = query_data["priority"]
-            stats["by_priority"][priority] = stats["by_priority"].get(priority, 0) + 1
             
             # Check for overdue queries
-            stored_time = datetime.fromisoformat(query_data["stored_at"].replace('Z', '+00:00').replace('+00:00', ''))
-            hours_pending = (current_time - stored_time).total_seconds() / 3600
-            
-            overdue_threshold = {
-                "critical": 2,
-                "high": 24,
-                "medium": 72
-            }.get(priority, 72)
+            hours_pending = (current_time - query_data["stored_at_monotonic"]) / 3600
             
-            if hours_pending > overdue_threshold:
+            if hours_pending > _OVERDUE_HOURS.get(priority, 72):
                 stats["overdue_queries"].append({
                     "query_id": query_id,
                     "priority": priority,
@@ -438,6 +564,107 @@ class RealtimeAlertAgent:
             "timestamp": get_current_time()
         }
     
+    def index_query(self, query_id, query_data):
+        """Add a query to the status, priority, user and keyword indexes"""
+        self.queries_by_status.setdefault(query_data["status"], {})[query_id] = None
+        self.queries_by_priority.setdefault(query_data["priority"], {})[query_id] = None
+        self.queries_by_user.setdefault(query_data["user_id"], {})[query_id] = None
+        for keyword in query_data["metadata"].get("keywords", ()):
+            self.queries_by_keyword.setdefault(keyword, {})[query_id] = None
+    
+    def unindex_query(self, query_id, query_data):
+        """Remove a query from the status, priority, user and keyword indexes"""
+        self._remove_from_index(self.queries_by_status, query_data["status"], query_id)
+        self._remove_from_index(self.queries_by_priority, query_data["priority"], query_id)
+        self._remove_from_index(self.queries_by_user, query_data["user_id"], query_id)
+        for keyword in query_data["metadata"].get("keywords", ()):
+            self._remove_from_index(self.queries_by_keyword, keyword, query_id)
+    
+    def set_query_status(self, query_id, query_data, status):
+        """Change a query's status and move it to the matching status bucket"""
+        self._remove_from_index(self.queries_by_status, query_data["status"], query_id)
+        query_data["status"] = status
+        self.queries_by_status.setdefault(status, {})[query_id] = None
+        self.pending_queries.move_to_end(query_id)
+    
+    def remove_query(self, query_id):
+        """Remove a stored query from the store and its indexes, returning its record"""
+        query_data = self.pending_queries.pop(query_id)
+        self.query_word_sets.pop(query_id, None)
+        self.unindex_query(query_id, query_data)
+        return query_data
+    
+    def evict_excess_queries(self):
+        """Evict the least recently stored or updated queries beyond max_pending_queries"""
+        while len(self.pending_queries) > self.max_pending_queries:
+            self.remove_query(next(iter(self.pending_queries)))
+        
+        # Evicted and replaced queries leave stale heap entries behind; rebuild the heap from
+        # the live records once they outnumber them, so it stays proportional to the store
+        if len(self.query_heap) > 2 * len(self.pending_queries) + 64:
+            self.query_heap = [
+                (query_data["stored_at_monotonic"], query_id)
+                for query_id, query_data in self.pending_queries.items()
+            ]
+            heapq.heapify(self.query_heap)
+    
+    def _remove_from_index(self, index, key, query_id):
+        """Drop query_id from an index bucket, removing the bucket once it is empty"""
+        bucket = index[key]
+        del bucket[query_id]
+        if not bucket:
+            del index[key]
+    
+    def _discard_stale_heap_entries(self):
+        """Drop heap entries whose query was removed or stored again since"""
+        while self.query_heap:
+            stored_monotonic, query_id = self.query_heap[0]
+            query_data = self.pending_queries.get(query_id)
+            if query_data is not None and query_data["stored_at_monotonic"] == stored_monotonic:
+                return
+            heapq.heappop(self.query_heap)
+    
+    def iter_stored_before(self, cutoff):
+        """Yield (query_id, query_data) for live queries stored before cutoff, oldest first"""
+        # Walk the heap in order through a frontier of (entry, position) without popping it;
+        # this visits only the entries older than cutoff plus their direct children
+        heap = self.query_heap
+        frontier = [(heap[0], 0)] if heap else []
+        
+        while frontier:
+            (stored_monotonic, query_id), position = heapq.heappop(frontier)
+            if stored_monotonic >= cutoff:
+                return
+            
+            query_data = self.pending_queries.get(query_id)
+            if query_data is not None and query_data["stored_at_monotonic"] == stored_monotonic:
+                yield query_id, query_data
+            
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+    
+    def peek_oldest(self):
+        """Return (query_id, query_data) for the oldest stored query, or None"""
+        self._discard_stale_heap_entries()
+        if not self.query_heap:
+            return None
+        query_id = self.query_heap[0][1]
+        return query_id, self.pending_queries[query_id]
+    
+    def pop_expired(self, max_age_seconds):
+        """Remove and return queries stored more than max_age_seconds ago, oldest first"""
+        cutoff = time.monotonic() - max_age_seconds
+        expired = {}
+        
+        self._discard_stale_heap_entries()
+        while self.query_heap and self.query_heap[0][0] < cutoff:
+            query_id = heapq.heappop(self.query_heap)[1]
+            expired[query_id] = self.remove_query(query_id)
+            self._discard_stale_heap_entries()
+        
+        return expired
+    
     def estimate_resolution_time(self, priority):
         """Estimate resolution time based on priority"""
         estimates = {
@@ -459,19 +686,12 @@ class RealtimeAlertAgent:
     
     def generate_query_id(self, input_data):
         """Generate unique query ID"""
-        user_id = input_data.get("user_id", "anonymous")
-        content = input_data.get("content", "")
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Create hash from user and content
-        hash_input = f"{user_id}_{content[:100]}_{timestamp}"
-        query_hash = hashlib.md5(hash_input.encode()).hexdigest()[:8]
-        
-        return f"QUERY_{timestamp}_{query_hash}"
+        return f"QUERY_{timestamp}_{_PROCESS_TAG}_{next(_ID_SEQUENCE):x}"
     
     def generate_alert_id(self, query_id, alert_type="standard"):
         """Generate unique alert ID"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        alert_hash = hashlib.md5(f"{query_id}_{alert_type}_{timestamp}".encode()).hexdigest()[:6]
         
-        return f"ALERT_{timestamp}_{alert_hash}"
+        return f"ALERT_{timestamp}_{_PROCESS_TAG}_{next(_ID_SEQUENCE):x}"